@@ -0,0 +1 @@
+"""스터디룸 예약 앱 성능 측정 도구."""
@@ -0,0 +1,81 @@
+"""벤치마크 실행기.
+
+    python -m benchmarks -o results.json
+    python -m benchmarks --rooms 12 --days 120 --bookings-per-day 60 --only micro
+    python -m benchmarks --rooms 4 --days 30 --only e2e
+    python -m benchmarks.compare before.json after.json
+
+가상 데이터를 임시 디렉터리에 만들고 마이크로벤치마크와 AppTest 재실행 측정을 돌린 뒤
+결과를 JSON 으로 남깁니다. 커밋마다 결과 파일을 모아 두면 benchmarks.compare 로 비교할 수 있습니다.
+--rooms 는 앱의 장소 목록(STUDYROOM_ROOMS)도 같이 정하므로, 다른 장소 목록으로 studyroom 을 이미
+불러온 프로세스에서는 실행할 수 없습니다.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="스터디룸 예약 앱 벤치마크")
+    parser.add_argument("--rooms", type=int, default=2, help="장소 수")
+    parser.add_argument("--days", type=int, default=120, help="생성할 기간(일). 누적 기록 길이이기도 합니다")
+    parser.add_argument("--bookings-per-day", type=int, default=16)
+    parser.add_argument("--team-min", type=int, default=3)
+    parser.add_argument("--team-max", type=int, default=6)
+    parser.add_argument("--active-days", type=int, default=2, help="활성 저장소에 남길 날 수 (나머지는 보관)")
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", choices=["micro", "e2e"], default=None)
+    parser.add_argument("-o", "--output", default="-", help="결과 JSON 경로 (기본값: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    rooms = [f"{i}번 스터디룸" for i in range(1, args.rooms + 1)]
+    # 앱은 ROOMS 를 import 할 때 읽으므로, studyroom 을 불러오기 전에 같은 장소 목록을 정해 둡니다.
+    os.environ["STUDYROOM_ROOMS"] = ",".join(rooms)
+    config = sys.modules.get("studyroom.config")
+    if config is not None and config.ROOMS != rooms:
+        parser.error(f"studyroom 이 이미 다른 장소 목록({', '.join(config.ROOMS)})으로 불려 있습니다.")
+    from benchmarks import datagen, micro
+
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "only")}
+    report = {"commit": _git_commit(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+              "python": platform.python_version(), "pandas": pd.__version__, "params": params}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        store, df = datagen.build_store(os.path.join(tmp, "bench.db"), rooms, args.days, args.bookings_per_day,
+                                        (args.team_min, args.team_max), args.active_days, args.students, args.seed)
+        report["data"] = {"generated_rows": len(df), "active_rows": len(store.snapshot()),
+                          "archive_segments": len(store.archive_dates()), "build_s": round(time.perf_counter() - t0, 3)}
+        if args.only in (None, "micro"):
+            report["micro"] = micro.run(store, df, rooms, args.seed, args.repeat)
+        if args.only in (None, "e2e"):
+            from benchmarks import e2e  # streamlit 은 e2e 측정에만 필요합니다.
+            report["e2e"] = e2e.run(store, df, rooms, args.repeat)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output == "-":
+        sys.stdout.write(text + "\n")
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
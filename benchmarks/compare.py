@@ -0,0 +1,46 @@
+"""두 벤치마크 결과 JSON 을 비교합니다.
+
+    python -m benchmarks.compare before.json after.json [--threshold 1.2]
+
+중앙값 기준으로 after/before 비율을 출력하고, threshold 배 넘게 느려진 항목이 있으면
+종료 코드 1 로 끝납니다.
+"""
+import argparse
+import json
+
+METRICS = {"micro": "median_us", "e2e": "median_ms"}
+
+
+def compare(before, after):
+    """(구분, 이름, 이전 값, 이후 값, 비율) 목록을 반환합니다."""
+    rows = []
+    for section, key in METRICS.items():
+        old, new = before.get(section, {}), after.get(section, {})
+        for name in sorted(set(old) & set(new)):
+            a, b = old[name][key], new[name][key]
+            rows.append((section, name, a, b, b / a if a else float("inf")))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+    with open(args.before, encoding="utf-8") as f:
+        before = json.load(f)
+    with open(args.after, encoding="utf-8") as f:
+        after = json.load(f)
+
+    print(f"{before.get('commit')} -> {after.get('commit')}")
+    regressed = False
+    for section, name, a, b, ratio in compare(before, after):
+        mark = " !" if ratio > args.threshold else ""
+        regressed |= ratio > args.threshold
+        print(f"{section:5} {name:40} {a:>12.2f} {b:>12.2f} {ratio:>6.2f}x{mark}")
+    raise SystemExit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""학기 규모의 가상 예약 데이터 생성기."""
+import random
+from datetime import timedelta
+
+import pandas as pd
+
+from studyroom.clock import get_kst_now
+from studyroom.store import COLUMNS, SqliteReservationStore
+
+DEPTS = ["스마트팜과학과", "식품생명공학과", "유전생명공학과", "융합바이오·신소재공학과"]
+FIRST_SLOT, LAST_SLOT = 18, 46  # 09:00 ~ 23:00 사이에 예약을 배치합니다 (30분 칸 번호).
+
+
+def _hhmm(slot):
+    return f"{slot // 2:02d}:{slot % 2 * 30:02d}"
+
+
+def generate_rows(rooms, days, bookings_per_day, team_size=(3, 6), students=5000, today=None, seed=0):
+    """today-days+2 ~ 내일까지 하루 bookings_per_day 건씩 예약 행을 만듭니다.
+
+    같은 방의 예약은 서로 겹치지 않고, 한 학생은 하루에 한 번만 예약에 참여합니다.
+    """
+    rng = random.Random(seed)
+    today = today or get_kst_now().date()
+    student_ids = [f"{2019000000 + i}" for i in range(students)]
+    rows = []
+    for offset in range(days - 2, -2, -1):
+        date = today - timedelta(days=offset)
+        pool = rng.sample(student_ids, len(student_ids))  # 그날 참여자는 겹치지 않게 앞에서부터 꺼내 씁니다.
+        next_free = {room: FIRST_SLOT for room in rooms}
+        for i in range(bookings_per_day):
+            room = rooms[i % len(rooms)]
+            start = next_free[room] + rng.randint(0, 2)
+            end = start + rng.randint(2, 6)  # 1~3시간
+            size = rng.randint(*team_size)
+            if end > LAST_SLOT or len(pool) < size:
+                continue
+            next_free[room] = end
+            team, pool = pool[:size], pool[size:]
+            attended = "입실완료" if offset > 0 or rng.random() < 0.5 else "미입실"
+            rows.append([rng.choice(DEPTS), f"학생{team[0][-4:]}", team[0], size, str(date), _hhmm(start), _hhmm(end),
+                         room, attended, ",".join(team[1:])])
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def build_store(path, rooms=("1번 스터디룸", "2번 스터디룸"), days=120, bookings_per_day=16, team_size=(3, 6),
+                active_days=2, students=5000, seed=0):
+    """가상 데이터를 채운 저장소를 만듭니다.
+
+    days 일치 예약을 모두 누적 기록에 넣고, 최근 active_days 일(오늘·내일 포함)만 활성 예약으로 남긴 채
+    나머지는 보관 세그먼트로 옮깁니다. active_days 를 days 로 주면 보관 없이 전부 활성으로 둡니다.
+    """
+    today = get_kst_now().date()
+    df = generate_rows(list(rooms), days, bookings_per_day, team_size, students, today, seed)
+    history = df.assign(신청일시=(df["날짜"] + " 09:00:00"))
+    store = SqliteReservationStore(path)
+    store.import_frames(df, history)
+    store.compact(today - timedelta(days=max(active_days - 2, 0)))
+    return store, df
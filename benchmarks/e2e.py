@@ -0,0 +1,104 @@
+"""Streamlit AppTest 로 app.py 전체 재실행(rerun) 시간을 탭별로 잽니다."""
+import os
+import statistics
+import time
+from datetime import timedelta
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.micro import use_store
+from studyroom.clock import get_kst_now
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+TIMEOUT = 60
+
+
+def _new_app(query_params=None):
+    at = AppTest.from_file(APP_PATH, default_timeout=TIMEOUT)
+    for k, v in (query_params or {}).items():
+        at.query_params[k] = v
+    return at
+
+
+def _timed_run(at, state=None):
+    # 탭·관리자 메뉴의 선택 상태는 AppTest 에서 재실행마다 초기화되므로 매번 다시 지정합니다.
+    for k, v in (state or {}).items():
+        at.session_state[k] = v
+    t0 = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(f"앱 실행 중 예외: {at.exception[0].value}")
+    return elapsed
+
+
+def scenarios(df, rooms):
+    """(이름, 세션 상태, 준비 함수) 목록. 준비 함수는 첫 실행을 마친 AppTest 에 위젯 조작을 걸어 둡니다.
+
+    세션 상태는 실행 전마다 지정할 값(열어 둘 탭 등)입니다. 선택되지 않은 탭은 그려지지 않습니다.
+
+    이름이 'load' 로 끝나는 시나리오는 조작 없이 첫 실행 시간을 잽니다.
+    """
+    now = get_kst_now().replace(tzinfo=None)
+    today, tomorrow = str(now.date()), str((now + timedelta(days=1)).date())
+    hot = df[df["날짜"].isin([today, tomorrow])]
+    sid = hot.iloc[0]["학번"] if len(hot) else "2019000000"
+    name = hot.iloc[0]["이름"] if len(hot) else "학생"
+
+    def booking_form(at):
+        at.selectbox(key="reg_count").set_value(6)
+        at.selectbox(key="reg_room").set_value(rooms[-1])
+
+    def lookup(at):
+        at.text_input(key="lookup_n").input(name)
+        at.text_input(key="lookup_s").input(sid)
+        at.button(key="btn_lookup").click()
+
+    def schedule(at):
+        box = at.selectbox(key="view_date")
+        box.set_value(box.options[-1])
+
+    def extension(at):
+        at.text_input(key="ext_id_input").input(sid)
+        at.button(key="btn_ext_check").click()
+
+    def cancel(at):
+        at.text_input(key="can_id_input").input(sid)
+        at.button(key="btn_can_lookup").click()
+
+    def admin(at):
+        at.text_input(key="admin_pw").input("bio1234")
+
+    def tab(label):
+        return {"main_tab": label}
+
+    return [
+        ("initial_load", None, None),
+        ("tab0_booking_form", None, booking_form),
+        ("tab1_lookup", tab("🔍 내 예약 확인"), lookup),
+        ("tab2_schedule", tab("📋 전체 예약 일정"), schedule),
+        ("tab3_extension", tab("➕ 시간 연장"), extension),
+        ("tab4_cancel", tab("♻️ 반납 및 취소"), cancel),
+        ("admin_panel", {"admin_open": True}, admin),
+        ("qr_checkin_load", None, None),
+    ]
+
+
+def run(store, df, rooms, repeat=5):
+    """시나리오마다 repeat 번 재실행 시간을 재서 ms 단위로 요약합니다."""
+    use_store(store)
+    results = {}
+    for name, state, prepare in scenarios(df, rooms):
+        samples = []
+        for _ in range(repeat):
+            at = _new_app({"checkin": "room1"} if name == "qr_checkin_load" else None)
+            if prepare is None:
+                samples.append(_timed_run(at, state))
+                continue
+            _timed_run(at, state)
+            prepare(at)
+            samples.append(_timed_run(at, state))
+        results[name] = {"runs": repeat, "min_ms": round(min(samples) * 1000, 2),
+                         "median_ms": round(statistics.median(samples) * 1000, 2),
+                         "mean_ms": round(statistics.fmean(samples) * 1000, 2)}
+    return results
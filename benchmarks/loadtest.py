@@ -0,0 +1,121 @@
+"""같은 시간대에 예약 요청을 한꺼번에 보내 중복 예약이 생기지 않는지 확인하는 부하 테스트.
+
+    python -m benchmarks.loadtest --attempts 300 --workers 64
+    python -m benchmarks.loadtest --mode process --workers 8
+
+임시 DB 를 만들어 서로 다른 팀들이 같은 방·같은 시간대를 동시에 신청하게 하고,
+처리량, 지연 시간 분위수, 실제로 생긴 겹침/중복 예약 수를 출력합니다.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from studyroom.store import SqliteReservationStore
+
+DATE = "2030-01-01"
+ROOM = "1번 스터디룸"
+
+
+def _booking(i, team_size, shared_every):
+    """i 번째 신청. shared_every 건마다 앞 팀의 팀원을 한 명 섞어 중복 예약 경로도 함께 태웁니다."""
+    rep = f"{2000000000 + i * 10}"
+    members = [f"{2000000000 + i * 10 + k}" for k in range(1, team_size)]
+    if shared_every and i % shared_every == 0 and i > 0:
+        members[0] = f"{2000000000 + (i - 1) * 10 + 1}"
+    start_h = 9 + (i % 3)  # 09~11시 시작, 모두 2시간짜리라 서로 겹칩니다.
+    return {"학과": "부하테스트", "이름": f"user{i}", "학번": rep, "인원": team_size, "날짜": DATE,
+            "시작": f"{start_h:02d}:00", "종료": f"{start_h + 2:02d}:00", "방번호": ROOM,
+            "출석": "미입실", "팀원학번": ",".join(members)}
+
+
+_store = None
+
+
+def _open_store(path):
+    """워커(스레드 모드에서는 프로세스 하나, 프로세스 모드에서는 각 프로세스)가 함께 쓸 저장소를 엽니다."""
+    global _store
+    _store = SqliteReservationStore(path)
+
+
+def _attempt(row):
+    t0 = time.perf_counter()
+    result = _store.reserve(row, "loadtest")
+    return time.perf_counter() - t0, result.ok, result.reason
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def count_violations(path):
+    """DB 에 남은 (시간 겹침 쌍 수, 같은 날 두 번 이상 예약된 학번 수) 를 셉니다."""
+    conn = sqlite3.connect(path)
+    overlaps = conn.execute(
+        'SELECT COUNT(*) FROM reservations a JOIN reservations b ON a.id < b.id AND a."날짜" = b."날짜" '
+        'AND a."방번호" = b."방번호" AND a."시작" < b."종료" AND b."시작" < a."종료"').fetchone()[0]
+    duplicates = conn.execute(
+        'SELECT COUNT(*) FROM (SELECT 1 FROM members GROUP BY "학번", "날짜" HAVING COUNT(*) > 1)').fetchone()[0]
+    conn.close()
+    return overlaps, duplicates
+
+
+def run(attempts=300, workers=64, mode="thread", team_size=6, shared_every=5, path=None):
+    tmpdir = None
+    if path is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmpdir.name, "loadtest.db")
+    _open_store(path)  # 스키마 생성
+    rows = [_booking(i, team_size, shared_every) for i in range(attempts)]
+
+    if mode == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_open_store, initargs=(path,))
+    t0 = time.perf_counter()
+    with pool:
+        results = list(pool.map(_attempt, rows))
+    elapsed = time.perf_counter() - t0
+
+    latencies = [r[0] for r in results]
+    reasons = {}
+    for _, ok, reason in results:
+        key = "ok" if ok else reason
+        reasons[key] = reasons.get(key, 0) + 1
+    overlaps, duplicates = count_violations(path)
+    report = {
+        "mode": mode, "workers": workers, "attempts": attempts,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(attempts / elapsed, 1) if elapsed else None,
+        "latency_ms": {q: round(_percentile(latencies, int(q[1:])) * 1000, 2) for q in ("p50", "p95", "p99")},
+        "outcomes": reasons,
+        "double_bookings": overlaps,
+        "duplicate_members": duplicates,
+    }
+    if tmpdir is not None:
+        tmpdir.cleanup()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest", description=__doc__.splitlines()[0])
+    parser.add_argument("--attempts", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread")
+    parser.add_argument("--team-size", type=int, default=6)
+    parser.add_argument("--shared-every", type=int, default=5, help="N 건마다 이전 팀원과 겹치는 학번을 넣습니다 (0 이면 없음)")
+    args = parser.parse_args(argv)
+    report = run(args.attempts, args.workers, args.mode, args.team_size, args.shared_every)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if report["double_bookings"] or report["duplicate_members"]:
+        raise SystemExit("중복 예약이 발생했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""핵심 조회·검사 함수 마이크로벤치마크."""
+import itertools
+import random
+import statistics
+import timeit
+from datetime import timedelta
+
+from studyroom import service, store as store_module
+from studyroom.clock import get_kst_now
+from studyroom.intervals import IntervalIndex
+from studyroom.occupancy import OccupancyGrid
+
+
+def use_store(store):
+    """service 함수들이 get_store() 로 이 저장소를 쓰도록 지정합니다."""
+    store_module._store = store
+
+
+def measure(fn, repeat=5, min_time=0.05):
+    """fn 한 번 호출에 걸리는 시간(µs)을 반복 측정해 요약합니다."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    runs = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {"loops": number, "min_us": round(min(runs), 3), "median_us": round(statistics.median(runs), 3),
+            "mean_us": round(statistics.fmean(runs), 3)}
+
+
+def run(store, df, rooms, seed=0, repeat=5):
+    """생성된 데이터(df)를 바탕으로 각 함수의 호출 시간을 잽니다. {이름: 측정 결과}"""
+    use_store(store)
+    rng = random.Random(seed)
+    now = get_kst_now().replace(tzinfo=None)
+    today, tomorrow = str(now.date()), str((now + timedelta(days=1)).date())
+    hot = df[df["날짜"].isin([today, tomorrow])]
+    booked = hot.iloc[rng.randrange(len(hot))] if len(hot) else None
+    team = ([booked["학번"]] + booked["팀원학번"].split(",")) if booked is not None else []
+    strangers = [f"{1990000000 + i}" for i in range(6)]
+    windows = [(rng.choice([today, tomorrow]), f"{h:02d}:00", f"{h + 2:02d}:00", rng.choice(rooms)) for h in range(9, 21)]
+    week = [str(now.date() + timedelta(days=i)) for i in range(7)]
+    snapshot = store.snapshot()
+
+    next_window = itertools.cycle(windows).__next__
+    cases = {
+        "get_latest_df/cached": lambda: service.get_latest_df(),
+        "get_latest_df/reload": lambda: (store._cache.invalidate(), service.get_latest_df()),
+        "check_overlap": lambda: service.check_overlap(*next_window()),
+        "check_overlap/index_build": lambda: IntervalIndex.from_frame(snapshot),
+        "check_team_duplication/hit": lambda: service.check_team_duplication(team, tomorrow),
+        "check_team_duplication/miss": lambda: service.check_team_duplication(strangers, tomorrow),
+        "find_reservations/lookup": lambda: service.find_reservations(team[-1] if team else strangers[0]),
+        "find_reservations/today": lambda: service.find_reservations(team[0] if team else strangers[0], today),
+        "find_reservations/miss": lambda: service.find_reservations(strangers[0]),
+        "process_qr_checkin/miss": lambda: store.check_in(rooms[0], today, "03:00", "03:15"),
+        "occupancy/free_starts": lambda: store.occupancy().free_starts(tomorrow, rooms[0]),
+        "occupancy/find_free_rooms_week": lambda: store.occupancy().find_free_rooms(week, "14:00", "16:00"),
+        "occupancy/grid_build": lambda: OccupancyGrid.from_frame(snapshot, rooms),
+    }
+    if booked is not None:
+        live = store.query(booked["날짜"], booked["방번호"])
+        booked_id = live.index[live["시작"] == booked["시작"]][0]
+        store.set_attendance(booked_id, "미입실")
+        args = (booked["방번호"], booked["날짜"], booked["시작"], booked["시작"])
+
+        def checkin_hit():
+            # 인증 후 곧바로 미입실로 되돌려 매 반복이 같은 조건에서 실행되게 합니다.
+            store.check_in(*args)
+            store.set_attendance(booked_id, "미입실")
+        cases["process_qr_checkin/hit+reset"] = checkin_hit
+        conflict = booked.to_dict()
+        cases["reserve/conflict"] = lambda: store.reserve(conflict, "bench")
+    return {name: measure(fn, repeat=repeat) for name, fn in cases.items()}
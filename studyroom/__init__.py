@@ -0,0 +1 @@
+"""생명과학대학 스터디룸 예약 앱의 데이터 계층."""
@@ -0,0 +1,53 @@
+"""관리용 명령행 도구: python -m studyroom <명령>"""
+import argparse
+import sys
+
+from studyroom import store
+from studyroom.clock import get_kst_now
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m studyroom", description="스터디룸 예약 데이터 관리 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="기존 reservations.csv / history.csv 를 저장소로 가져옵니다")
+    p_import.add_argument("--reservations", default=store.LEGACY_DB_FILE)
+    p_import.add_argument("--history", default=store.LEGACY_HISTORY_FILE)
+
+    p_compact = sub.add_parser("compact", help="지난 날짜의 예약을 날짜별 보관 세그먼트로 옮깁니다")
+    p_compact.add_argument("--before", default=None, help="이 날짜(YYYY-MM-DD) 이전을 보관합니다. 기본값은 오늘(KST)")
+
+    p_export = sub.add_parser("export-history", help="누적 전체 기록을 CSV 로 내보냅니다 (조각 단위로 기록)")
+    p_export.add_argument("output", nargs="?", default="-", help="저장할 파일 경로 (기본값: 표준 출력)")
+    p_export.add_argument("--from", dest="date_from", default=None)
+    p_export.add_argument("--to", dest="date_to", default=None)
+    p_export.add_argument("--room", default=None)
+    p_export.add_argument("--student", dest="student_id", default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == "import":
+        db = store.SqliteReservationStore(store.DB_PATH)
+        counts = store.import_legacy_csv(db, args.reservations, args.history)
+        if counts is None:
+            parser.error(f"{store.DB_PATH} 에는 이미 기존 데이터를 가져왔습니다 ({db.legacy_imported()}). 중복 적재를 막기 위해 중단합니다.")
+        n_res, n_hist = counts
+        print(f"예약 {n_res}건, 누적 기록 {n_hist}건을 {store.DB_PATH} 로 가져왔습니다.")
+    elif args.command == "compact":
+        db = store.SqliteReservationStore(store.DB_PATH)
+        before = args.before or str(get_kst_now().date())
+        moved = db.compact(before)
+        print(f"{before} 이전 예약 {moved}건을 {db.archive_dir} 로 옮겼습니다.")
+    elif args.command == "export-history":
+        db = store.SqliteReservationStore(store.DB_PATH)
+        chunks = db.iter_history_csv(date_from=args.date_from, date_to=args.date_to, room=args.room, student_id=args.student_id)
+        out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+        try:
+            for chunk in chunks:
+                out.write(chunk)
+        finally:
+            if out is not sys.stdout.buffer:
+                out.close()
+
+
+if __name__ == "__main__":
+    main()
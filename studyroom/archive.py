@@ -0,0 +1,50 @@
+"""Parquet 보관 세그먼트.
+
+이용이 끝난 날짜의 예약은 archive/<날짜>.parquet 로, 지난 달의 누적 기록은
+history/<연-월>.parquet 로 옮겨집니다. 세그먼트 이름(키)만으로 필요한 파일을 고를 수 있습니다.
+"""
+import os
+
+import pandas as pd
+
+from studyroom import metrics
+
+SUFFIX = ".parquet"
+
+
+def segment_path(segment_dir, key):
+    return os.path.join(segment_dir, f"{key}{SUFFIX}")
+
+
+def list_segments(segment_dir):
+    """세그먼트 키 목록(오름차순)을 반환합니다."""
+    if not os.path.isdir(segment_dir):
+        return []
+    return sorted(name[:-len(SUFFIX)] for name in os.listdir(segment_dir) if name.endswith(SUFFIX))
+
+
+def read_segment(segment_dir, key, columns=None):
+    """세그먼트를 읽습니다. columns 를 주면 그 열만 읽습니다. 없으면 None."""
+    path = segment_path(segment_dir, key)
+    if not os.path.isfile(path):
+        return None
+    df = pd.read_parquet(path, columns=columns)
+    metrics.count_read(df)
+    return df
+
+
+def write_segment(segment_dir, key, df, sort_by=("방번호", "시작")):
+    """세그먼트에 행을 더합니다. 같은 id 가 이미 있으면 한 번만 남깁니다.
+
+    임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 기존 세그먼트는 손상되지 않습니다.
+    """
+    os.makedirs(segment_dir, exist_ok=True)
+    existing = read_segment(segment_dir, key)
+    df = df.reset_index()
+    if existing is not None:
+        df = pd.concat([existing, df], ignore_index=True).drop_duplicates(subset="id", keep="last")
+    path = segment_path(segment_dir, key)
+    tmp = path + ".tmp"
+    df.sort_values(by=list(sort_by)).to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+    metrics.count_write(os.path.getsize(path))
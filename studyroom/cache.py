@@ -0,0 +1,40 @@
+"""여러 세션이 함께 쓰는 읽기 캐시."""
+import threading
+
+import pandas as pd
+
+# 스냅샷은 얕은 복사로 나눠 주므로, 호출자가 수정해도 캐시 원본이 바뀌지 않도록 CoW 를 켭니다.
+# (pandas 3 부터는 기본 동작)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+class SnapshotCache:
+    """버전 키가 바뀔 때만 다시 읽어 오는 프로세스 공용 캐시.
+
+    load() 는 새 값을 읽어 오는 함수, version() 은 현재 데이터 버전을 나타내는
+    값을 돌려주는 함수입니다. 버전이 같으면 저장해 둔 값을 그대로 돌려줍니다.
+    """
+
+    def __init__(self, load, version):
+        self._load = load
+        self._version = version
+        self._lock = threading.Lock()
+        self._entry = None  # (버전 키, 값)
+
+    def get(self):
+        key = self._version()
+        entry = self._entry
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        with self._lock:
+            # 다른 세션이 먼저 읽어 두었을 수 있으므로 잠금 안에서 다시 확인합니다.
+            key = self._version()
+            entry = self._entry
+            if entry is None or entry[0] != key:
+                entry = (key, self._load())
+                self._entry = entry
+            return entry[1]
+
+    def invalidate(self):
+        self._entry = None
@@ -0,0 +1,7 @@
+"""시간 관련 공용 함수."""
+from datetime import datetime, timedelta, timezone
+
+
+def get_kst_now():
+    """서버 시간(UTC)을 한국 시간(KST)으로 변환합니다."""
+    return datetime.now(timezone.utc) + timedelta(hours=9)
@@ -0,0 +1,26 @@
+"""운영 설정."""
+import os
+
+# 예약 가능한 장소 목록. 환경 변수 STUDYROOM_ROOMS 에 쉼표로 구분해 넣으면 바꿀 수 있습니다.
+ROOMS = [r.strip() for r in os.environ.get("STUDYROOM_ROOMS", "1번 스터디룸,2번 스터디룸").split(",") if r.strip()]
+
+# QR 코드의 ?checkin= 값 -> 장소 이름. 기본값은 room1, room2, ... 를 ROOMS 순서대로 잇습니다.
+# 환경 변수 STUDYROOM_ROOM_CODES 에 "room1=1번 스터디룸,room2=2번 스터디룸" 형식으로 바꿀 수 있습니다.
+def _parse_room_codes(text):
+    """"코드=장소,코드=장소" 를 읽습니다. 앞뒤 공백은 무시하고, 형식이 틀린 항목은 어떤 항목인지 밝혀 거부합니다."""
+    codes = {}
+    for entry in filter(None, (e.strip() for e in text.split(","))):
+        code, sep, room = (part.strip() for part in entry.partition("="))
+        if not sep or not code or not room:
+            raise ValueError(f"STUDYROOM_ROOM_CODES 항목 '{entry}' 은(는) '코드=장소' 형식이어야 합니다.")
+        if room not in ROOMS:
+            raise ValueError(f"STUDYROOM_ROOM_CODES 항목 '{entry}' 의 장소가 ROOMS 에 없습니다: {', '.join(ROOMS)}")
+        codes[code] = room
+    return codes
+
+
+ROOM_CODES = _parse_room_codes(os.environ["STUDYROOM_ROOM_CODES"]) \
+    if os.environ.get("STUDYROOM_ROOM_CODES", "").strip() else {f"room{i}": room for i, room in enumerate(ROOMS, 1)}
+
+# 사이드바 실시간 현황을 다시 그리는 주기(초). 사이드바만 따로 다시 실행됩니다.
+SIDEBAR_REFRESH = int(os.environ.get("STUDYROOM_SIDEBAR_REFRESH", "60"))
@@ -0,0 +1,87 @@
+"""누적 전체 기록의 조회·내보내기.
+
+기록은 이번 달 분량만 SQLite history 표에 쌓이고, 지난 달은 history/<연-월>.parquet
+세그먼트로 굴려 보관됩니다. 조회는 날짜 범위에 해당하는 세그먼트만 읽고, 건수를 셀 때는
+필터에 필요한 열만 읽습니다.
+"""
+import pandas as pd
+
+from studyroom import archive, metrics
+
+FILTER_COLUMNS = ["id", "날짜", "방번호", "학번", "팀원학번"]
+EXPORT_BATCH_ROWS = 5000
+
+
+def month_of(date):
+    return str(date)[:7]
+
+
+def filter_mask(df, date_from=None, date_to=None, room=None, student_id=None):
+    """필터 조건에 맞는 행을 나타내는 불리언 Series 를 반환합니다."""
+    mask = pd.Series(True, index=df.index)
+    if date_from:
+        mask &= df["날짜"] >= str(date_from)
+    if date_to:
+        mask &= df["날짜"] <= str(date_to)
+    if room:
+        mask &= df["방번호"] == room
+    if student_id:
+        sid = student_id.strip()
+        mask &= (df["학번"] == sid) | ("," + df["팀원학번"] + ",").str.contains(f",{sid},", regex=False)
+    return mask
+
+
+def segment_keys(history_dir, date_from=None, date_to=None):
+    """날짜 범위에 걸치는 월 세그먼트 키만 골라 반환합니다."""
+    keys = archive.list_segments(history_dir)
+    if date_from:
+        keys = [k for k in keys if k >= month_of(date_from)]
+    if date_to:
+        keys = [k for k in keys if k <= month_of(date_to)]
+    return keys
+
+
+def page(sources, columns, page_no, page_size, **filters):
+    """최신 기록부터 page_no 번째 페이지를 반환합니다. (페이지 DataFrame, 전체 건수)
+
+    sources 는 최신순으로 나열된 읽기 함수 목록이며, 각 함수는 읽을 열 목록(None 이면 전체)을 받습니다.
+    전체 건수는 필터 열만 읽어 세고, 페이지에 걸치는 세그먼트만 전체 열을 읽습니다.
+    """
+    start, end = page_no * page_size, (page_no + 1) * page_size
+    total, parts = 0, []
+    for load in sources:
+        keys = load(FILTER_COLUMNS)
+        matched = keys.loc[filter_mask(keys, **filters), "id"].sort_values(ascending=False)
+        n = len(matched)
+        if total < end and total + n > start:
+            ids = matched.iloc[max(0, start - total):min(n, end - total)]
+            parts.append(load(None).set_index("id").loc[ids])
+        total += n
+    if not parts:
+        return pd.DataFrame(columns=columns), total
+    return pd.concat(parts), total
+
+
+def iter_segment_batches(history_dir, key, batch_rows=EXPORT_BATCH_ROWS):
+    """월 세그먼트를 batch_rows 행씩 DataFrame 으로 읽어 냅니다."""
+    import pyarrow.parquet as pq  # 내보내기에서만 쓰므로 앱 시작 시 불러오지 않습니다.
+
+    parquet = pq.ParquetFile(archive.segment_path(history_dir, key))
+    for batch in parquet.iter_batches(batch_size=batch_rows):
+        df = batch.to_pandas()
+        metrics.count_read(df)
+        yield df
+
+
+def iter_csv(batches, columns, **filters):
+    """DataFrame 묶음을 CSV 바이트 조각으로 바꿔 차례로 내보냅니다. 첫 조각에만 BOM 과 머리글이 붙습니다."""
+    first = True
+    for df in batches:
+        df = df[filter_mask(df, **filters)]
+        if df.empty:
+            continue
+        chunk = df[columns].to_csv(index=False, header=first)
+        yield (("\ufeff" if first else "") + chunk).encode("utf-8")
+        first = False
+    if first:
+        yield ("\ufeff" + ",".join(columns) + "\n").encode("utf-8")
@@ -0,0 +1,77 @@
+"""(날짜, 방번호) 별 예약 시간 구간 색인."""
+import bisect
+import logging
+from itertools import accumulate
+
+logger = logging.getLogger(__name__)
+
+
+def to_minutes(hhmm):
+    """'HH:MM' 문자열을 자정 기준 분 단위 정수로 바꿉니다."""
+    h, m = hhmm.split(":")
+    return int(h) * 60 + int(m)
+
+
+def to_hhmm(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class IntervalIndex:
+    """방·날짜마다 예약 구간 [시작, 종료) 를 시작 시각 순으로 정렬해 둔 색인.
+
+    충돌 검사와 다음 예약 조회는 모두 이분 탐색으로 처리합니다.
+    """
+
+    def __init__(self):
+        # (날짜, 방번호) -> (시작 목록, 종료 목록, 종료의 누적 최댓값 목록)
+        self._rooms = {}
+        self.malformed = 0
+
+    @classmethod
+    def from_frame(cls, df):
+        index = cls()
+        spans = {}
+        for date, room, start, end in zip(df["날짜"], df["방번호"], df["시작"], df["종료"]):
+            try:
+                span = (to_minutes(start), to_minutes(end))
+            except (ValueError, AttributeError):
+                index.malformed += 1
+                continue
+            spans.setdefault((date, room), []).append(span)
+        for key, items in spans.items():
+            items.sort()
+            starts = [s for s, _ in items]
+            ends = [e for _, e in items]
+            index._rooms[key] = (starts, ends, list(accumulate(ends, max)))
+        if index.malformed:
+            logger.warning("시간 형식이 잘못된 예약 %d건을 색인에서 제외했습니다.", index.malformed)
+        return index
+
+    def collides(self, date, room, start, end):
+        """[start, end) 가 기존 예약과 겹치는지 확인합니다."""
+        entry = self._rooms.get((str(date), room))
+        if entry is None:
+            return False
+        starts, _, max_ends = entry
+        s, e = to_minutes(start), to_minutes(end)
+        # 시작이 e 보다 이른 예약들 가운데 가장 늦게 끝나는 것이 s 이후에 끝나면 겹칩니다.
+        i = bisect.bisect_left(starts, e)
+        return i > 0 and max_ends[i - 1] > s
+
+    def next_start(self, date, room, t):
+        """t 이후(같은 시각 포함)에 시작하는 첫 예약의 시작 시각을 반환합니다. 없으면 None."""
+        entry = self._rooms.get((str(date), room))
+        if entry is None:
+            return None
+        starts = entry[0]
+        i = bisect.bisect_left(starts, to_minutes(t))
+        return to_hhmm(starts[i]) if i < len(starts) else None
+
+    def bookings_after(self, date, room, t):
+        """t 보다 늦게 시작하는 예약들을 (시작, 종료) 문자열 쌍 목록으로 반환합니다."""
+        entry = self._rooms.get((str(date), room))
+        if entry is None:
+            return []
+        starts, ends, _ = entry
+        i = bisect.bisect_right(starts, to_minutes(t))
+        return [(to_hhmm(s), to_hhmm(e)) for s, e in zip(starts[i:], ends[i:])]
@@ -0,0 +1,39 @@
+"""학번 -> 예약 역색인."""
+
+
+def participants(rep_id, member_ids):
+    """대표자와 팀원 학번을 중복·빈 값 없이 한 목록으로 정리합니다."""
+    if isinstance(member_ids, str):
+        member_ids = member_ids.split(",")
+    seen = []
+    for sid in [rep_id, *member_ids]:
+        sid = str(sid).strip()
+        if sid and sid not in seen:
+            seen.append(sid)
+    return seen
+
+
+class MemberIndex:
+    """참여자(대표자+팀원) 학번마다 날짜별 예약 id 를 모아 둔 색인.
+
+    부분 문자열 검색 대신 사전 조회만으로 중복 예약 검사와 개인 예약 조회를 처리합니다.
+    """
+
+    def __init__(self, rows=()):
+        # 학번 -> {날짜: [예약 id, ...]}
+        self._by_student = {}
+        for reservation_id, student_id, date in rows:
+            self._by_student.setdefault(student_id, {}).setdefault(date, []).append(reservation_id)
+
+    def has_booking(self, student_id, date):
+        """해당 학번이 그 날짜에 참여하는 예약이 있는지 확인합니다."""
+        return bool(self._by_student.get(student_id, {}).get(str(date)))
+
+    def reservation_ids(self, student_id, date=None):
+        """해당 학번이 참여하는 예약 id 목록(등록 순)을 반환합니다. date 를 주면 그 날짜만 봅니다."""
+        by_date = self._by_student.get(student_id)
+        if not by_date:
+            return []
+        if date is not None:
+            return sorted(by_date.get(str(date), []))
+        return sorted(rid for ids in by_date.values() for rid in ids)
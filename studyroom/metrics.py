@@ -0,0 +1,256 @@
+"""재실행(rerun) 구간 계측.
+
+앱 스크립트는 재실행마다 begin_rerun() 으로 기록을 열고, 데이터 적재·사이드바·각 탭 같은 구간을
+phase(이름) 로 감쌉니다. 저장소는 읽기/쓰기 횟수와 바이트(count_read, count_write), 쓰기 작업별
+지연(mutation)을 알립니다. 끝난 기록은 프로세스 공용 링 버퍼에 최근 RING_SIZE 건만 남습니다.
+
+    STUDYROOM_METRICS=0              계측을 끕니다. phase() 는 공용 빈 컨텍스트를, 나머지 함수는 곧바로 반환합니다.
+    STUDYROOM_METRICS_FILE=<경로>    누적 지표를 Prometheus 텍스트 형식으로 FILE_INTERVAL 초마다 씁니다.
+"""
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+ENABLED = os.environ.get("STUDYROOM_METRICS", "1") != "0"
+METRICS_FILE = os.environ.get("STUDYROOM_METRICS_FILE") or None
+RING_SIZE = 500
+FILE_INTERVAL = 10.0
+QUANTILES = (0.5, 0.95, 0.99)
+
+_NOOP = nullcontext()
+_local = threading.local()  # 스크립트 스레드(세션)마다 진행 중인 재실행 기록
+_lock = threading.Lock()
+_recent = deque(maxlen=RING_SIZE)     # 끝난 재실행 기록
+_mutations = deque(maxlen=RING_SIZE)  # (작업, 초)
+_totals = {"reruns": 0, "reads": 0, "read_bytes": 0, "writes": 0, "written_bytes": 0}
+_phase_totals = {}     # 구간 -> [횟수, 합계(초)]
+_mutation_totals = {}  # 작업 -> [횟수, 합계(초)]
+_last_flush = 0.0
+
+
+class Rerun:
+    """재실행 한 번의 기록. 시간은 초 단위이고, interrupted 는 st.rerun()/st.stop() 등으로 중간에 끝났다는 뜻입니다."""
+
+    __slots__ = ("started_at", "kind", "t0", "total", "phases", "reads", "read_bytes", "writes", "written_bytes",
+                 "mutations", "interrupted")
+
+    def __init__(self, kind):
+        self.started_at = time.time()
+        self.kind = kind
+        self.t0 = time.perf_counter()
+        self.total = 0.0
+        self.phases = {}
+        self.reads = self.read_bytes = self.writes = self.written_bytes = 0
+        self.mutations = []
+        self.interrupted = False
+
+
+def _size(data):
+    """바이트 수(int), DataFrame(메모리 크기), 또는 값·행 목록(문자열로 바꾼 UTF-8 길이)의 크기."""
+    if isinstance(data, int):
+        return data
+    if hasattr(data, "memory_usage"):
+        return int(data.memory_usage(index=False, deep=True).sum())
+    return sum(len(str(v).encode()) for row in data for v in (row if isinstance(row, (tuple, list)) else (row,)))
+
+
+def begin_rerun(kind="script"):
+    """이 스레드의 새 재실행 기록을 엽니다. 끝내지 못한 이전 기록은 버립니다."""
+    if ENABLED:
+        _local.rerun = Rerun(kind)
+
+
+def end_rerun(interrupted=False):
+    """진행 중인 기록을 닫아 링 버퍼에 넣습니다."""
+    rerun = getattr(_local, "rerun", None) if ENABLED else None
+    if rerun is None:
+        return
+    _local.rerun = None
+    rerun.total = time.perf_counter() - rerun.t0
+    rerun.interrupted = interrupted
+    with _lock:
+        _recent.append(rerun)
+        _totals["reruns"] += 1
+        for name, seconds in [("전체", rerun.total), *rerun.phases.items()]:
+            acc = _phase_totals.setdefault(name, [0, 0.0])
+            acc[0] += 1
+            acc[1] += seconds
+    if METRICS_FILE:
+        _maybe_flush()
+
+
+@contextmanager
+def _phase(rerun, name):
+    t0 = time.perf_counter()
+    depth = getattr(_local, "depth", 0)  # 바깥에 열려 있는 구간 수
+    _local.depth = depth + 1
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        _local.depth = depth
+        rerun.phases[name] = rerun.phases.get(name, 0.0) + time.perf_counter() - t0
+        if not ok and depth == 0:
+            # st.rerun()/st.stop() 도 예외로 빠져나오므로, 여기서 기록을 닫지 않으면 그 재실행은 남지 않습니다.
+            # 안쪽 구간은 바깥 구간이 시간을 더한 뒤 닫도록 맨 바깥 구간에서만 닫습니다.
+            end_rerun(interrupted=True)
+
+
+def active():
+    """이 스레드에 진행 중인 재실행 기록이 있는지."""
+    return ENABLED and getattr(_local, "rerun", None) is not None
+
+
+def phase(name):
+    """with 문으로 감싼 구간의 경과 시간을 진행 중인 재실행 기록에 더합니다."""
+    rerun = getattr(_local, "rerun", None) if ENABLED else None
+    return _NOOP if rerun is None else _phase(rerun, name)
+
+
+def count_read(data):
+    if not ENABLED:
+        return
+    nbytes = _size(data)
+    rerun = getattr(_local, "rerun", None)
+    if rerun is not None:
+        rerun.reads += 1
+        rerun.read_bytes += nbytes
+    with _lock:
+        _totals["reads"] += 1
+        _totals["read_bytes"] += nbytes
+
+
+def count_write(data):
+    if not ENABLED:
+        return
+    nbytes = _size(data)
+    rerun = getattr(_local, "rerun", None)
+    if rerun is not None:
+        rerun.writes += 1
+        rerun.written_bytes += nbytes
+    with _lock:
+        _totals["writes"] += 1
+        _totals["written_bytes"] += nbytes
+
+
+def mutation(op, seconds):
+    """쓰기 작업 한 건의 지연(잠금 대기 포함)을 남깁니다."""
+    if not ENABLED:
+        return
+    rerun = getattr(_local, "rerun", None)
+    if rerun is not None:
+        rerun.mutations.append((op, seconds))
+    with _lock:
+        _mutations.append((op, seconds))
+        acc = _mutation_totals.setdefault(op, [0, 0.0])
+        acc[0] += 1
+        acc[1] += seconds
+
+
+def _quantile(values, q):
+    """정렬된 값에서 nearest-rank 분위수."""
+    return values[min(len(values) - 1, max(0, int(q * len(values) + 0.5) - 1))]
+
+
+def _summarize(samples):
+    """{이름: [초, ...]} -> 이름별 횟수·분위수(ms) 행 목록."""
+    rows = []
+    for name, values in sorted(samples.items()):
+        values.sort()
+        row = {"구간": name, "횟수": len(values)}
+        row.update({f"p{round(q * 100)} (ms)": round(_quantile(values, q) * 1000, 2) for q in QUANTILES})
+        rows.append(row)
+    return rows
+
+
+def recent():
+    """링 버퍼의 재실행 기록(오래된 순)."""
+    with _lock:
+        return list(_recent)
+
+
+def phase_summary():
+    """최근 재실행의 구간별 p50/p95/p99. '전체' 는 재실행 한 번 전체 시간입니다."""
+    samples = {"전체": []}
+    for rerun in recent():
+        samples["전체"].append(rerun.total)
+        for name, seconds in rerun.phases.items():
+            samples.setdefault(name, []).append(seconds)
+    return _summarize(samples) if samples["전체"] else []
+
+
+def mutation_summary():
+    """최근 쓰기 작업별 지연 p50/p95/p99."""
+    with _lock:
+        items = list(_mutations)
+    samples = {}
+    for op, seconds in items:
+        samples.setdefault(op, []).append(seconds)
+    return _summarize(samples)
+
+
+def slowest(n=10):
+    """최근 재실행 중 가장 느린 n 건을 표 행으로 돌려줍니다."""
+    rows = []
+    for rerun in sorted(recent(), key=lambda r: r.total, reverse=True)[:n]:
+        top = max(rerun.phases.items(), key=lambda kv: kv[1], default=("-", 0.0))
+        rows.append({"시각": time.strftime("%m-%d %H:%M:%S", time.localtime(rerun.started_at)), "종류": rerun.kind,
+                     "전체 (ms)": round(rerun.total * 1000, 2), "가장 긴 구간": f"{top[0]} ({top[1] * 1000:.1f}ms)",
+                     "읽기": rerun.reads, "읽은 KB": round(rerun.read_bytes / 1024, 1),
+                     "쓰기": rerun.writes, "쓴 KB": round(rerun.written_bytes / 1024, 1),
+                     "쓰기 지연 (ms)": round(sum(s for _, s in rerun.mutations) * 1000, 2), "조기 종료": rerun.interrupted})
+    return rows
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text():
+    """누적 지표와 최근 분위수를 Prometheus 텍스트 형식으로 만듭니다."""
+    with _lock:
+        totals = dict(_totals)
+        phases = {k: list(v) for k, v in _phase_totals.items()}
+        mutations = {k: list(v) for k, v in _mutation_totals.items()}
+    lines = []
+    for key, help_text in [("reruns", "끝난 재실행 수"), ("reads", "저장소 읽기 횟수"), ("read_bytes", "저장소에서 읽은 바이트"),
+                           ("writes", "저장소 쓰기 횟수"), ("written_bytes", "저장소에 쓴 바이트")]:
+        lines += [f"# HELP studyroom_{key}_total {help_text}", f"# TYPE studyroom_{key}_total counter",
+                  f"studyroom_{key}_total {totals[key]}"]
+    for metric, label, totals_by_name, summary in [("phase", "phase", phases, phase_summary()),
+                                                   ("mutation", "op", mutations, mutation_summary())]:
+        lines += [f"# HELP studyroom_{metric}_seconds 최근 {RING_SIZE}건 기준 분위수와 누적 합계",
+                  f"# TYPE studyroom_{metric}_seconds summary"]
+        for row in summary:
+            for q in QUANTILES:
+                lines.append(f'studyroom_{metric}_seconds{{{label}="{_label(row["구간"])}",quantile="{q}"}} '
+                             f'{row[f"p{round(q * 100)} (ms)"] / 1000:.6f}')
+        for name, (count, total) in sorted(totals_by_name.items()):
+            lines.append(f'studyroom_{metric}_seconds_sum{{{label}="{_label(name)}"}} {total:.6f}')
+            lines.append(f'studyroom_{metric}_seconds_count{{{label}="{_label(name)}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path=None):
+    """지표 파일을 씁니다. 임시 파일에 쓴 뒤 교체하므로 수집기가 반쯤 쓴 파일을 읽지 않습니다."""
+    path = path or METRICS_FILE
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+
+
+def _maybe_flush():
+    global _last_flush
+    now = time.monotonic()
+    with _lock:
+        if now - _last_flush < FILE_INTERVAL:
+            return
+        _last_flush = now
+    try:
+        write_prometheus()
+    except OSError:
+        pass  # 지표 파일을 못 써도 화면 처리는 계속합니다.
@@ -0,0 +1,117 @@
+"""날짜·장소별 30분 단위 점유 격자."""
+import numpy as np
+
+from studyroom.intervals import to_hhmm, to_minutes
+
+SLOT_MINUTES = 30
+SLOTS = 24 * 60 // SLOT_MINUTES  # 하루 48칸
+SLOT_LABELS = [to_hhmm(i * SLOT_MINUTES) for i in range(SLOTS)]
+
+
+def slot_range(start, end):
+    """[start, end) 가 걸치는 칸 범위 (첫 칸, 마지막 칸 + 1) 를 반환합니다."""
+    s = to_minutes(start) // SLOT_MINUTES
+    e = -(-to_minutes(end) // SLOT_MINUTES)
+    return s, min(max(e, s), SLOTS)
+
+
+class OccupancyGrid:
+    """(날짜, 장소, 칸) 3차원 NumPy 배열로 하루 48칸의 점유 상태를 들고 있는 격자.
+
+    칸마다 그 시간을 차지한 예약 수를 세어 두므로, 예약 하나를 빼도 겹쳐 있던 다른 예약의
+    점유는 그대로 남습니다. 예약이 추가·삭제·연장될 때마다 해당 칸만 고칩니다.
+    """
+
+    def __init__(self, rooms):
+        self.rooms = list(rooms)
+        self.configured = len(self.rooms)  # self.rooms 앞쪽의 이만큼이 설정된 장소입니다.
+        self.dates = []
+        self._room_pos = {room: i for i, room in enumerate(self.rooms)}
+        self._date_pos = {}
+        self.counts = np.zeros((0, len(self.rooms), SLOTS), dtype=np.int16)
+
+    @classmethod
+    def from_frame(cls, df, rooms):
+        grid = cls(rooms)
+        for date, room, start, end in zip(df["날짜"], df["방번호"], df["시작"], df["종료"]):
+            try:
+                grid.add(date, room, start, end)
+            except (ValueError, AttributeError):
+                continue  # 시간 형식 오류는 IntervalIndex 에서 집계·기록합니다.
+        return grid
+
+    def _date_index(self, date, create=False):
+        date = str(date)
+        if date in self._date_pos:
+            return self._date_pos[date]
+        if not create:
+            return None
+        self._date_pos[date] = len(self.dates)
+        self.dates.append(date)
+        self.counts = np.concatenate([self.counts, np.zeros((1, len(self.rooms), SLOTS), dtype=np.int16)])
+        return len(self.dates) - 1
+
+    def _room_index(self, room, create=False):
+        if room in self._room_pos:
+            return self._room_pos[room]
+        if not create:
+            return None
+        # 설정에 없는 장소의 예약(이전 데이터 등)도 자리를 만들어 둡니다.
+        self._room_pos[room] = len(self.rooms)
+        self.rooms.append(room)
+        self.counts = np.concatenate([self.counts, np.zeros((len(self.dates), 1, SLOTS), dtype=np.int16)], axis=1)
+        return len(self.rooms) - 1
+
+    def add(self, date, room, start, end, delta=1):
+        s, e = slot_range(start, end)
+        d, r = self._date_index(date, create=True), self._room_index(room, create=True)
+        self.counts[d, r, s:e] += delta
+
+    def remove(self, date, room, start, end):
+        self.add(date, room, start, end, delta=-1)
+
+    def free_slots(self, date, room):
+        """해당 장소·날짜의 칸별 빈 자리 여부(길이 48 불리언 배열)를 반환합니다."""
+        d, r = self._date_index(date), self._room_index(room)
+        if d is None or r is None:
+            return np.ones(SLOTS, dtype=bool)
+        return self.counts[d, r] == 0
+
+    def is_free(self, date, room, start, end):
+        s, e = slot_range(start, end)
+        return bool(self.free_slots(date, room)[s:e].all())
+
+    def occupied(self, date, room, t):
+        """t 시각이 속한 칸이 예약으로 차 있는지 확인합니다."""
+        return not self.free_slots(date, room)[to_minutes(t) // SLOT_MINUTES]
+
+    def free_starts(self, date, room):
+        """예약을 시작할 수 있는(그 칸이 비어 있는) 시각 목록."""
+        return [SLOT_LABELS[i] for i in np.flatnonzero(self.free_slots(date, room))]
+
+    def free_ends(self, date, room, start):
+        """start 에서 시작해 다음 점유 칸 전까지 이어서 쓸 수 있는 종료 시각 목록."""
+        free = self.free_slots(date, room)
+        s = to_minutes(start) // SLOT_MINUTES
+        ends = []
+        for i in range(s, SLOTS - 1):  # 종료 선택지는 기존과 같이 23:30 까지입니다.
+            if not free[i]:
+                break
+            ends.append(SLOT_LABELS[i + 1])
+        return ends
+
+    def find_free_rooms(self, dates, start, end):
+        """여러 날짜에 걸쳐 [start, end) 가 통째로 빈 (날짜, 장소) 목록을 반환합니다.
+
+        격자에 없는 날짜는 모든 장소가 비어 있는 것으로 봅니다. 설정에 없는 장소(이전 데이터로만
+        생긴 자리)는 예약할 수 없으므로 제안하지 않습니다.
+        """
+        s, e = slot_range(start, end)
+        dates = [str(d) for d in dates]
+        known = [self._date_index(d) for d in dates]
+        window_busy = np.zeros((len(dates), self.configured), dtype=bool)
+        rows = [i for i, d in enumerate(known) if d is not None]
+        if rows:
+            window_busy[rows] = (self.counts[[known[i] for i in rows], :self.configured, s:e] > 0).any(axis=2)
+        d_idx, r_idx = np.nonzero(~window_busy)
+        return [(dates[d], self.rooms[r]) for d, r in zip(d_idx, r_idx)]
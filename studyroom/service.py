@@ -0,0 +1,30 @@
+"""화면에서 쓰는 조회·검사 함수. Streamlit 에 의존하지 않아 벤치마크에서도 그대로 불러 씁니다."""
+from studyroom import metrics
+from studyroom.store import get_store
+
+
+def get_latest_df():
+    """실시간 예약 데이터를 읽어옵니다. 모든 세션이 공유하는 캐시에서 변경이 있을 때만 다시 읽습니다."""
+    with metrics.phase("data_load"):
+        return get_store().snapshot()
+
+
+def check_team_duplication(member_ids, target_date):
+    """대표자 및 팀원 중 한 명이라도 해당 날짜에 이미 예약이 있는지 전수 검사합니다."""
+    members = get_store().members()
+    for m_id in member_ids:
+        if m_id and members.has_booking(m_id, target_date):
+            return True, m_id
+    return False, ""
+
+
+def find_reservations(student_id, date=None):
+    """대표자 또는 팀원으로 참여한 예약을 학번 역색인으로 찾습니다."""
+    df = get_latest_df()
+    ids = get_store().members().reservation_ids(student_id.strip(), date)
+    return df.loc[[i for i in ids if i in df.index]]
+
+
+def check_overlap(date, start_t, end_t, room):
+    """해당 날짜/장소에 [start_t, end_t) 와 겹치는 예약이 있는지 구간 색인으로 확인합니다."""
+    return get_store().intervals().collides(date, room, start_t, end_t)
@@ -0,0 +1,607 @@
+"""예약 데이터 저장소.
+
+앱은 ReservationStore 인터페이스만 사용하며, 기본 백엔드는 WAL 모드의 SQLite입니다.
+예약 한 건의 입실/연장/삭제는 해당 행만 갱신하는 단일 SQL 문으로 처리되어
+다른 세션의 변경을 덮어쓰지 않습니다.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from contextlib import contextmanager
+
+import pandas as pd
+
+from studyroom import archive, history, metrics
+from studyroom.cache import SnapshotCache
+from studyroom.config import ROOMS
+from studyroom.intervals import IntervalIndex
+from studyroom.members import MemberIndex, participants
+from studyroom.occupancy import OccupancyGrid
+
+logger = logging.getLogger(__name__)
+
+# 데이터 저장 파일명
+DB_PATH = os.environ.get("STUDYROOM_DB", "reservations.db")
+LEGACY_DB_FILE = "reservations.csv"
+LEGACY_HISTORY_FILE = "history.csv"
+
+COLUMNS = ["학과", "이름", "학번", "인원", "날짜", "시작", "종료", "방번호", "출석", "팀원학번"]
+HISTORY_COLUMNS = COLUMNS + ["신청일시"]
+TEXT_COLUMNS = ["이름", "학번", "날짜", "시작", "종료", "방번호", "팀원학번"]
+
+# 예약 시도 결과. 실패 시 reason 은 아래 사유 중 하나이고, 중복 예약이면 student_id 에 해당 학번이 담깁니다.
+ReserveResult = namedtuple("ReserveResult", ["ok", "reason", "student_id"])
+DUPLICATE = "duplicate"  # 참여자 중 누군가 같은 날짜에 이미 예약이 있음
+OVERLAP = "overlap"      # 같은 방·날짜에 시간이 겹치는 예약이 있음
+BUSY = "busy"            # 대기 한도 안에 쓰기 잠금을 얻지 못함
+STALE = "stale"          # 대상 예약이 그사이 취소되었거나 바뀜
+RESERVE_TIMEOUT = 5.0    # 예약 한 건이 잠금을 기다리는 최대 시간(초)
+COMPACT_RETRY = 600      # 정리가 오류로 실패한 뒤 다시 시도하기까지 기다리는 시간(초)
+POOL_SIZE = 4            # 풀에 남겨 둘 유휴 연결 수
+
+
+class StoreBusyError(RuntimeError):
+    """대기 한도 안에 쓰기 잠금을 얻지 못했을 때 발생합니다."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reservations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    "학과" TEXT, "이름" TEXT, "학번" TEXT, "인원" INTEGER,
+    "날짜" TEXT, "시작" TEXT, "종료" TEXT, "방번호" TEXT,
+    "출석" TEXT DEFAULT '미입실', "팀원학번" TEXT DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_res_date_room ON reservations ("날짜", "방번호");
+CREATE INDEX IF NOT EXISTS idx_res_student ON reservations ("학번");
+CREATE TABLE IF NOT EXISTS members (
+    reservation_id INTEGER NOT NULL REFERENCES reservations(id) ON DELETE CASCADE,
+    "학번" TEXT NOT NULL, "날짜" TEXT NOT NULL,
+    PRIMARY KEY (reservation_id, "학번")
+);
+CREATE INDEX IF NOT EXISTS idx_members_student ON members ("학번", "날짜");
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    "학과" TEXT, "이름" TEXT, "학번" TEXT, "인원" INTEGER,
+    "날짜" TEXT, "시작" TEXT, "종료" TEXT, "방번호" TEXT,
+    "출석" TEXT, "팀원학번" TEXT, "신청일시" TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+LEGACY_IMPORT_KEY = "legacy_import"  # 기존 CSV 를 가져온 시각
+
+
+def _quote(cols):
+    return ", ".join(f'"{c}"' for c in cols)
+
+
+def normalize_frame(df, columns=COLUMNS):
+    """CSV 등 외부에서 읽은 예약 프레임을 저장소 형식으로 정리합니다."""
+    df = df.copy()
+    if "출석" not in df.columns:
+        df["출석"] = "미입실"
+    if "팀원학번" not in df.columns:
+        df["팀원학번"] = ""
+    for col in columns:
+        if col not in df.columns:
+            df[col] = ""
+    for col in TEXT_COLUMNS:
+        df[col] = df[col].fillna("").astype(str).str.strip()
+    df["인원"] = pd.to_numeric(df["인원"], errors="coerce").fillna(0).astype(int)
+    return df[columns]
+
+
+class ReservationStore(ABC):
+    """예약 저장소 인터페이스.
+
+    예약 한 건은 스냅샷 DataFrame 의 인덱스인 예약 id 로 식별합니다. 다른 백엔드를 붙이려면
+    이 클래스를 상속해 추상 메서드를 구현하면 됩니다.
+    """
+
+    def __init__(self):
+        self._compacted_for = None
+        self._compact_retry_at = 0.0
+        self._compact_lock = threading.Lock()
+
+    @abstractmethod
+    def reserve(self, row, requested_at):
+        """중복·겹침 검사와 추가를 하나의 원자적 작업으로 수행하고 ReserveResult 를 반환합니다."""
+
+    @abstractmethod
+    def set_attendance(self, reservation_id, status):
+        """예약 한 건의 출석 상태를 바꾸고, 바꾼 행 수(없으면 0)를 반환합니다."""
+
+    @abstractmethod
+    def set_end_time(self, reservation_id, current_end, new_end):
+        """예약의 종료 시각을 new_end 로 바꾸고 ReserveResult 를 반환합니다.
+
+        종료가 아직 current_end 인지, 늘어난 구간이 같은 방의 다른 예약과 겹치지 않는지를
+        변경과 같은 원자적 작업 안에서 확인합니다. 실패 사유는 STALE, OVERLAP, BUSY 중 하나입니다.
+        """
+
+    @abstractmethod
+    def check_in(self, room, date, now_time, early_limit):
+        """해당 장소에서 지금 입실 인증할 수 있는 첫 예약을 '입실완료' 로 바꾸고 대표자 이름을 반환합니다.
+
+        시작이 early_limit 이전이고 종료가 now_time 이후인 미입실 예약이 대상이며, 없으면 None 입니다.
+        """
+
+    @abstractmethod
+    def delete(self, reservation_id):
+        """예약 한 건을 지우고, 지운 행 수(이미 없으면 0)를 반환합니다."""
+
+    @abstractmethod
+    def query(self, date=None, room=None, student_id=None):
+        """조건에 맞는 활성 예약을 DataFrame 으로 반환합니다."""
+
+    def snapshot(self):
+        """전체 활성 예약의 읽기 전용 스냅샷을 반환합니다."""
+        return self.query()
+
+    def intervals(self):
+        """현재 스냅샷으로 만든 (날짜, 방번호) 별 시간 구간 색인을 반환합니다."""
+        return IntervalIndex.from_frame(self.snapshot())
+
+    def occupancy(self):
+        """현재 스냅샷으로 만든 날짜·장소별 점유 격자를 반환합니다."""
+        return OccupancyGrid.from_frame(self.snapshot(), ROOMS)
+
+    def members(self):
+        """학번 -> 예약 id 역색인을 반환합니다."""
+        df = self.snapshot()
+        return MemberIndex((rid, sid, date) for rid, rep, team, date in zip(df.index, df["학번"], df["팀원학번"], df["날짜"])
+                           for sid in participants(rep, team))
+
+    @abstractmethod
+    def history_page(self, page_no=0, page_size=50, **filters):
+        """누적 기록을 최신순으로 한 페이지 읽습니다. (DataFrame, 전체 건수)
+
+        filters: date_from, date_to, room, student_id
+        """
+
+    @abstractmethod
+    def iter_history_csv(self, **filters):
+        """누적 기록을 오래된 순으로 CSV 바이트 조각씩 내보냅니다."""
+
+    @abstractmethod
+    def compact(self, today):
+        """today 이전 날짜의 예약을 보관 세그먼트로, 지난 달 누적 기록을 월별 세그먼트로 옮깁니다.
+
+        보관 세그먼트로 옮긴 예약 수를 반환합니다.
+        """
+
+    def ensure_compacted(self, today):
+        """그날 처음 불렸을 때만 compact 를 실행합니다.
+
+        자정 직후 여러 세션이 한꺼번에 들어와도 한 세션만 정리하고, 나머지는 기다리지 않고 돌아갑니다.
+        쓰기 잠금을 얻지 못하면 화면은 그대로 그리고 다음 요청에서 다시 시도합니다. 그 밖의 오류는
+        기록만 남기고 COMPACT_RETRY 초 동안 다시 시도하지 않으므로, 정리가 실패해도 화면은 그려집니다.
+        """
+        if self._compacted_for == str(today) or time.monotonic() < self._compact_retry_at:
+            return
+        if not self._compact_lock.acquire(blocking=False):
+            return
+        try:
+            if self._compacted_for != str(today):
+                self.compact(today)
+                self._compacted_for = str(today)
+        except StoreBusyError as e:
+            logger.warning("지난 예약 정리를 미룹니다: %s", e)
+        except Exception:
+            logger.exception("지난 예약 정리에 실패했습니다. %d초 뒤 다시 시도합니다.", COMPACT_RETRY)
+            self._compact_retry_at = time.monotonic() + COMPACT_RETRY
+        finally:
+            self._compact_lock.release()
+
+    @abstractmethod
+    def archive_dates(self):
+        """보관된 날짜 목록을 반환합니다."""
+
+    @abstractmethod
+    def archived(self, date):
+        """보관된 해당 날짜의 예약을 DataFrame 으로 반환합니다."""
+
+
+class SqliteReservationStore(ReservationStore):
+    """WAL 모드 SQLite 백엔드.
+
+    읽기/쓰기 연결은 작은 풀에서 빌려 쓰고 곧바로 돌려놓습니다. 스레드마다 연결을 두면 끝난 스크립트
+    스레드의 연결이 GC 때 닫히면서 WAL 파일이 지워졌다 생기기를 반복합니다. 변경 감지는 오래 두는
+    연결 하나(_watch)의 PRAGMA data_version 으로 하며, 이 값은 다른 연결이 커밋했을 때만 바뀝니다.
+    """
+
+    def __init__(self, path=DB_PATH, archive_dir=None):
+        super().__init__()
+        self.path = path
+        self.archive_dir = archive_dir or os.path.join(os.path.dirname(os.path.abspath(path)), "archive")
+        self.history_dir = os.path.join(os.path.dirname(self.archive_dir), "history")
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        self._watch = self._open()
+        self._watch_lock = threading.Lock()
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._cache = SnapshotCache(self.query, self.version)
+        self._interval_cache = SnapshotCache(lambda: IntervalIndex.from_frame(self._cache.get()), self.version)
+        self._member_cache = SnapshotCache(self._load_members, self.version)
+        # 점유 격자는 다시 만들지 않고 쓰기마다 해당 칸만 고칩니다. _grid_version 은 격자가 반영한 데이터 버전입니다.
+        self._grid = None
+        self._grid_version = None
+        self._grid_lock = threading.Lock()
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+        with self._transaction("backfill") as (conn, _):
+            self._backfill_members(conn)
+            self._backfill_import_mark(conn)
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, timeout=RESERVE_TIMEOUT, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def _conn(self):
+        """풀에서 연결을 빌립니다. 풀이 비었으면 새로 열고, 돌려놓을 때 POOL_SIZE 를 넘으면 닫습니다."""
+        with self._pool_lock:
+            conn = self._pool.pop() if self._pool else None
+        if conn is None:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            with self._pool_lock:
+                if len(self._pool) < POOL_SIZE:
+                    self._pool.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def close(self):
+        """풀과 변경 감지 연결을 닫습니다."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            conn.close()
+        with self._watch_lock:
+            self._watch.close()
+
+    @contextmanager
+    def _transaction(self, op="write", timeout=RESERVE_TIMEOUT):
+        """쓰기 트랜잭션. 프로세스 안에서는 _write_lock, 프로세스 사이에서는 BEGIN IMMEDIATE 로 직렬화합니다.
+
+        본문은 (연결, 격자 변경 목록) 을 받아, 점유 격자에 반영할 변경을
+        (날짜, 장소, 시작, 종료, ±1) 형태로 목록에 담습니다. 실제로 바뀐 행이 있을 때만
+        캐시를 무효화합니다. 잠금 대기부터 커밋까지 걸린 시간은 op 이름으로 계측에 남깁니다.
+        """
+        t0 = time.perf_counter()
+        if not self._write_lock.acquire(timeout=timeout):
+            metrics.mutation(op, time.perf_counter() - t0)
+            raise StoreBusyError("쓰기 잠금 대기 시간 초과")
+        try:
+            with self._conn() as conn:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                except sqlite3.OperationalError as e:
+                    raise StoreBusyError(str(e)) from e
+                changes_before = conn.total_changes
+                grid_changes = []
+                try:
+                    yield conn, grid_changes
+                    # 커밋부터 격자 반영까지 격자 잠금을 쥐고 있어야, 그 사이 다른 세션이 새 데이터로
+                    # 격자를 다시 만든 뒤 같은 변경이 한 번 더 더해지는 일이 없습니다.
+                    with self._grid_lock:
+                        # 쓰기 잠금을 쥐고 있어 커밋 전 데이터는 그대로이므로, 격자의 최신 여부를 여기서 판단합니다.
+                        grid_fresh = self._grid is not None and self._grid_version == self.version()
+                        conn.execute("COMMIT")
+                        if conn.total_changes != changes_before:
+                            self._bump()
+                            self._apply_grid(grid_fresh, grid_changes)
+                except BaseException:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+        finally:
+            self._write_lock.release()
+            metrics.mutation(op, time.perf_counter() - t0)
+
+    def _apply_grid(self, grid_fresh, grid_changes):
+        """커밋된 변경을 점유 격자에 반영합니다. _grid_lock 을 쥔 상태로 호출합니다."""
+        if not grid_fresh or None in grid_changes:
+            self._grid = None  # 다음 조회 때 새로 만듭니다.
+            return
+        for date, room, start, end, delta in grid_changes:
+            self._grid.add(date, room, start, end, delta)
+        self._grid_version = self.version()
+
+    def _bump(self):
+        """쓰기 세대를 올려 캐시된 스냅샷을 무효화합니다."""
+        with self._generation_lock:
+            self._generation += 1
+        self._cache.invalidate()
+        self._interval_cache.invalidate()
+        self._member_cache.invalidate()
+
+    def version(self):
+        """현재 데이터 버전. 이 프로세스의 쓰기 세대와 _watch 연결의 data_version(다른 연결의 커밋)을 함께 봅니다."""
+        with self._watch_lock:
+            return self._generation, self._watch.execute("PRAGMA data_version").fetchone()[0]
+
+    def snapshot(self):
+        # 캐시 원본은 공유되므로 얕은 복사본을 돌려줍니다 (Copy-on-Write 로 원본 보호).
+        return self._cache.get().copy(deep=False)
+
+    def intervals(self):
+        # 색인은 읽기 전용이므로 복사 없이 공유합니다.
+        return self._interval_cache.get()
+
+    def occupancy(self):
+        # 격자도 읽기 전용으로 공유합니다. 다른 프로세스가 썼거나 아직 없으면 스냅샷에서 새로 만듭니다.
+        with self._grid_lock:
+            version = self.version()
+            if self._grid is None or self._grid_version != version:
+                self._grid = OccupancyGrid.from_frame(self._cache.get(), ROOMS)
+                self._grid_version = version
+            return self._grid
+
+    def members(self):
+        return self._member_cache.get()
+
+    def _load_members(self):
+        with self._conn() as conn:
+            rows = conn.execute('SELECT reservation_id, "학번", "날짜" FROM members').fetchall()
+        metrics.count_read(rows)
+        return MemberIndex(rows)
+
+    def _backfill_members(self, conn):
+        """참여자 행이 없는 예약(가져온 데이터 등)에 대해 members 행을 채웁니다."""
+        rows = conn.execute('SELECT id, "학번", "팀원학번", "날짜" FROM reservations '
+                            'WHERE id NOT IN (SELECT reservation_id FROM members)').fetchall()
+        conn.executemany('INSERT OR IGNORE INTO members (reservation_id, "학번", "날짜") VALUES (?, ?, ?)',
+                         [(rid, sid, date) for rid, rep, team, date in rows for sid in participants(rep, team)])
+
+    def _backfill_import_mark(self, conn):
+        """가져오기 표시가 생기기 전에 만든 DB 는, 데이터나 세그먼트가 있으면 이미 가져온 것으로 표시합니다."""
+        if conn.execute("SELECT 1 FROM meta WHERE key = ?", (LEGACY_IMPORT_KEY,)).fetchone():
+            return
+        if conn.execute("SELECT 1 FROM reservations LIMIT 1").fetchone() or conn.execute("SELECT 1 FROM history LIMIT 1").fetchone() \
+                or archive.list_segments(self.archive_dir) or archive.list_segments(self.history_dir):
+            conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (LEGACY_IMPORT_KEY, "기존 데이터"))
+
+    def _insert(self, conn, row, requested_at):
+        values = [row[c] for c in COLUMNS]
+        cur = conn.execute(f"INSERT INTO reservations ({_quote(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})", values)
+        conn.executemany('INSERT OR IGNORE INTO members (reservation_id, "학번", "날짜") VALUES (?, ?, ?)',
+                         [(cur.lastrowid, sid, row["날짜"]) for sid in participants(row["학번"], row["팀원학번"])])
+        conn.execute(f"INSERT INTO history ({_quote(HISTORY_COLUMNS)}) VALUES ({', '.join('?' * len(HISTORY_COLUMNS))})", values + [requested_at])
+        metrics.count_write(values + [requested_at])
+
+    def reserve(self, row, requested_at):
+        # 검사와 추가 사이에 다른 세션·프로세스가 끼어들지 못하도록 한 쓰기 트랜잭션 안에서 처리합니다.
+        try:
+            with self._transaction("reserve") as (conn, grid_changes):
+                ids = participants(row["학번"], row["팀원학번"])
+                taken = {sid for (sid,) in conn.execute(
+                    f'SELECT "학번" FROM members WHERE "날짜" = ? AND "학번" IN ({", ".join("?" * len(ids))})', [row["날짜"], *ids])}
+                if taken:
+                    return ReserveResult(False, DUPLICATE, next(sid for sid in ids if sid in taken))
+                if conn.execute('SELECT 1 FROM reservations WHERE "날짜" = ? AND "방번호" = ? AND "시작" < ? AND "종료" > ? LIMIT 1',
+                                (row["날짜"], row["방번호"], row["종료"], row["시작"])).fetchone():
+                    return ReserveResult(False, OVERLAP, "")
+                self._insert(conn, row, requested_at)
+                grid_changes.append((row["날짜"], row["방번호"], row["시작"], row["종료"], +1))
+        except StoreBusyError:
+            return ReserveResult(False, BUSY, "")
+        return ReserveResult(True, "", "")
+
+    def set_attendance(self, reservation_id, status):
+        with self._transaction("set_attendance") as (conn, _):
+            metrics.count_write([status])
+            return conn.execute('UPDATE reservations SET "출석" = ? WHERE id = ?', (status, int(reservation_id))).rowcount
+
+    def check_in(self, room, date, now_time, early_limit):
+        with self._transaction("check_in") as (conn, _):
+            # (날짜, 방번호) 색인으로 그날 그 방의 예약만 보고, 찾은 한 행만 갱신합니다.
+            found = conn.execute('SELECT id, "이름" FROM reservations WHERE "날짜" = ? AND "방번호" = ? AND "시작" <= ? '
+                                 'AND "종료" > ? AND "출석" = \'미입실\' ORDER BY id LIMIT 1',
+                                 (str(date), room, early_limit, now_time)).fetchone()
+            if found is None:
+                return None
+            conn.execute('UPDATE reservations SET "출석" = \'입실완료\' WHERE id = ?', (found[0],))
+            metrics.count_write(["입실완료"])
+            return found[1]
+
+    def set_end_time(self, reservation_id, current_end, new_end):
+        # 연장 선택지를 보여준 뒤 다른 팀이 바로 뒤 시간을 예약했을 수 있으므로, reserve 처럼 검사와 변경을 한 트랜잭션에서 합니다.
+        try:
+            with self._transaction("set_end_time") as (conn, grid_changes):
+                row = conn.execute('SELECT "날짜", "방번호", "시작", "종료" FROM reservations WHERE id = ?', (int(reservation_id),)).fetchone()
+                if row is None or row[3] != current_end:
+                    return ReserveResult(False, STALE, "")
+                date, room, start, end = row
+                if conn.execute('SELECT 1 FROM reservations WHERE "날짜" = ? AND "방번호" = ? AND id <> ? AND "시작" < ? AND "종료" > ? LIMIT 1',
+                                (date, room, int(reservation_id), new_end, start)).fetchone():
+                    return ReserveResult(False, OVERLAP, "")
+                conn.execute('UPDATE reservations SET "종료" = ? WHERE id = ?', (new_end, int(reservation_id)))
+                metrics.count_write([new_end])
+                grid_changes += [(date, room, start, end, -1), (date, room, start, new_end, +1)]
+        except StoreBusyError:
+            return ReserveResult(False, BUSY, "")
+        return ReserveResult(True, "", "")
+
+    def delete(self, reservation_id):
+        with self._transaction("delete") as (conn, grid_changes):
+            row = conn.execute('SELECT "날짜", "방번호", "시작", "종료" FROM reservations WHERE id = ?', (int(reservation_id),)).fetchone()
+            if row is None:
+                return 0
+            conn.execute("DELETE FROM reservations WHERE id = ?", (int(reservation_id),))
+            metrics.count_write([reservation_id])
+            grid_changes.append((*row, -1))
+        return 1
+
+    def query(self, date=None, room=None, student_id=None):
+        where, params = [], []
+        if date is not None:
+            where.append('"날짜" = ?'); params.append(str(date))
+        if room is not None:
+            where.append('"방번호" = ?'); params.append(room)
+        if student_id is not None:
+            where.append('"학번" = ?'); params.append(student_id)
+        sql = f"SELECT id, {_quote(COLUMNS)} FROM reservations"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._frame(sql + " ORDER BY id", params, COLUMNS)
+
+    def _live_history(self, columns=None, date_from=None, date_to=None):
+        """아직 세그먼트로 옮기지 않은 이번 달 기록을 id 열과 함께 읽습니다."""
+        columns = columns or ["id"] + HISTORY_COLUMNS
+        sql = f"SELECT {_quote(columns)} FROM history WHERE 1 = 1"
+        params = []
+        if date_from:
+            sql += ' AND "날짜" >= ?'; params.append(str(date_from))
+        if date_to:
+            sql += ' AND "날짜" <= ?'; params.append(str(date_to))
+        with self._conn() as conn:
+            df = pd.DataFrame(conn.execute(sql + " ORDER BY id", params).fetchall(), columns=columns)
+        metrics.count_read(df)
+        return df
+
+    def history_page(self, page_no=0, page_size=50, **filters):
+        date_from, date_to = filters.get("date_from"), filters.get("date_to")
+        sources = [lambda cols: self._live_history(cols, date_from, date_to)]
+        for key in reversed(history.segment_keys(self.history_dir, date_from, date_to)):
+            sources.append(lambda cols, key=key: archive.read_segment(self.history_dir, key, cols))
+        return history.page(sources, HISTORY_COLUMNS, page_no, page_size, **filters)
+
+    def iter_history_csv(self, **filters):
+        def batches():
+            for key in history.segment_keys(self.history_dir, filters.get("date_from"), filters.get("date_to")):
+                yield from history.iter_segment_batches(self.history_dir, key)
+            with self._conn() as conn:  # 끝까지 읽거나 생성기가 닫힐 때 돌려놓습니다.
+                cur = conn.execute(f"SELECT {_quote(HISTORY_COLUMNS)} FROM history ORDER BY id")
+                while rows := cur.fetchmany(history.EXPORT_BATCH_ROWS):
+                    df = pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+                    metrics.count_read(df)
+                    yield df
+        return history.iter_csv(batches(), HISTORY_COLUMNS, **filters)
+
+    def roll_history(self, month):
+        """month(YYYY-MM) 이전 달의 기록을 월별 세그먼트로 옮기고, 옮긴 건수를 반환합니다."""
+        moved = 0
+        with self._conn() as conn:
+            months = [m for (m,) in conn.execute('SELECT DISTINCT substr("날짜", 1, 7) FROM history WHERE substr("날짜", 1, 7) < ?', (month,))]
+        for m in months:
+            with self._transaction("roll_history") as (conn, _):
+                rows = conn.execute(f'SELECT id, {_quote(HISTORY_COLUMNS)} FROM history WHERE substr("날짜", 1, 7) = ?', (m,)).fetchall()
+                if not rows:  # 다른 프로세스가 먼저 옮겼습니다.
+                    continue
+                df = pd.DataFrame(rows, columns=["id"] + HISTORY_COLUMNS).set_index("id")
+                archive.write_segment(self.history_dir, m, df, sort_by=("id",))
+                conn.execute('DELETE FROM history WHERE substr("날짜", 1, 7) = ?', (m,))
+            moved += len(rows)
+        return moved
+
+    def compact(self, today):
+        self.roll_history(history.month_of(today))
+        moved = 0
+        with self._conn() as conn:
+            dates = [d for (d,) in conn.execute('SELECT DISTINCT "날짜" FROM reservations WHERE "날짜" < ?', (str(today),))]
+        for date in dates:
+            # 날짜마다 세그먼트를 먼저 쓰고 활성 저장소에서 지웁니다. 중간에 멈춰도 다시 실행하면
+            # 같은 id 는 세그먼트에서 한 번만 남으므로 예약이 사라지거나 두 번 보관되지 않습니다.
+            with self._transaction("compact") as (conn, grid_changes):
+                df = self._frame(f'SELECT id, {_quote(COLUMNS)} FROM reservations WHERE "날짜" = ? ORDER BY id', (date,), COLUMNS,
+                                 conn)
+                if not df.empty:
+                    archive.write_segment(self.archive_dir, date, df)
+                    conn.execute('DELETE FROM reservations WHERE "날짜" = ?', (date,))
+                grid_changes.append(None)  # 날짜 단위로 빠지므로 격자는 새로 만듭니다.
+            moved += len(df)
+        return moved
+
+    def archive_dates(self):
+        return archive.list_segments(self.archive_dir)
+
+    def archived(self, date):
+        df = archive.read_segment(self.archive_dir, date)
+        return None if df is None else df.set_index("id")
+
+    def _frame(self, sql, params, columns, conn=None):
+        if conn is None:
+            with self._conn() as conn:
+                rows = conn.execute(sql, params).fetchall()
+        else:
+            rows = conn.execute(sql, params).fetchall()
+        df = pd.DataFrame(rows, columns=["id"] + columns).set_index("id")
+        df["인원"] = df["인원"].astype(int)
+        metrics.count_read(df)
+        return df
+
+    def import_frames(self, reservations=None, history=None, legacy=False):
+        """기존 CSV 에서 읽은 프레임을 한 트랜잭션으로 옮겨 담습니다.
+
+        legacy=True 이면 기존 CSV 를 가져왔다는 표시를 같은 트랜잭션에 남기고, 이미 표시가 있으면
+        아무것도 하지 않습니다. 정리로 활성 표가 비어도 같은 CSV 를 다시 가져오지 않습니다.
+        가져왔으면 True 를 반환합니다.
+        """
+        with self._transaction("import") as (conn, grid_changes):
+            if legacy:
+                if conn.execute("SELECT 1 FROM meta WHERE key = ?", (LEGACY_IMPORT_KEY,)).fetchone():
+                    return False
+                conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (LEGACY_IMPORT_KEY, time.strftime("%Y-%m-%d %H:%M:%S")))
+            if reservations is not None and not reservations.empty:
+                df = normalize_frame(reservations)
+                conn.executemany(f"INSERT INTO reservations ({_quote(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                                 df.itertuples(index=False, name=None))
+                metrics.count_write(df)
+                self._backfill_members(conn)
+                grid_changes.append(None)
+            if history is not None and not history.empty:
+                df = normalize_frame(history, HISTORY_COLUMNS)
+                df["신청일시"] = df["신청일시"].fillna("").astype(str)
+                conn.executemany(f"INSERT INTO history ({_quote(HISTORY_COLUMNS)}) VALUES ({', '.join('?' * len(HISTORY_COLUMNS))})",
+                                 df.itertuples(index=False, name=None))
+                metrics.count_write(df)
+        return True
+
+    def legacy_imported(self):
+        """기존 CSV 를 가져온 시각(또는 '기존 데이터')을 반환합니다. 가져온 적이 없으면 None."""
+        with self._conn() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (LEGACY_IMPORT_KEY,)).fetchone()
+        return None if row is None else row[0]
+
+
+def import_legacy_csv(store, db_file=LEGACY_DB_FILE, history_file=LEGACY_HISTORY_FILE):
+    """reservations.csv / history.csv 를 저장소로 한 번에 가져옵니다. 가져온 행 수를 반환합니다.
+
+    이미 가져온 저장소면 아무것도 하지 않고 None 을 반환합니다.
+    """
+    reservations = pd.read_csv(db_file, dtype=str) if os.path.isfile(db_file) else None
+    history = pd.read_csv(history_file, dtype=str) if os.path.isfile(history_file) else None
+    if not store.import_frames(reservations, history, legacy=True):
+        return None
+    return (0 if reservations is None else len(reservations)), (0 if history is None else len(history))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """프로세스 전체가 공유하는 저장소를 반환합니다.
+
+    기존 CSV 파일이 있고 아직 가져온 적이 없으면 자동으로 가져옵니다.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = SqliteReservationStore(DB_PATH)
+                if store.legacy_imported() is None and (os.path.isfile(LEGACY_DB_FILE) or os.path.isfile(LEGACY_HISTORY_FILE)):
+                    import_legacy_csv(store)
+                _store = store
+    return _store
@@ -0,0 +1,5 @@
+"""Streamlit 화면 구성.
+
+사이드바와 각 탭은 fragment 로 그려, 그 안의 위젯을 조작하면 해당 부분만 다시 실행됩니다.
+QR 입실 화면(qr)과 예약 화면(page)은 app.py 가 필요한 쪽만 불러옵니다.
+"""
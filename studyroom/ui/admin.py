@@ -0,0 +1,88 @@
+"""관리자 메뉴 (누적 기록 보존)."""
+import streamlit as st
+
+from studyroom import metrics
+from studyroom.config import ROOMS
+from studyroom.service import get_latest_df
+from studyroom.store import get_store
+from studyroom.ui.common import fragment
+
+
+def live_reservations():
+    st.markdown("#### 📍 현재 활성 예약")
+    df_ad = get_latest_df()
+    if not df_ad.empty:
+        st.dataframe(df_ad, width="stretch")
+        labels = [f"{r['이름']} | {r['날짜']} | {r['시작']} ({r['방번호']})" for _, r in df_ad.iterrows()]
+        sel = st.selectbox("삭제 대상을 선택하세요", range(len(labels)), format_func=lambda x: labels[x])
+        if st.button("강제 삭제"):
+            t = df_ad.iloc[sel]
+            get_store().delete(t.name)
+            st.rerun()
+    else: st.info("활성 예약 내역 없음")
+
+
+def history_records():
+    st.markdown("#### 📜 누적 전체 기록 히스토리")
+    hc1, hc2, hc3 = st.columns([1.6, 1, 1])
+    h_range = hc1.date_input("기간", value=(), key="hist_range")
+    h_room = hc2.selectbox("장소", ["전체"] + ROOMS, key="hist_room")
+    h_sid = hc3.text_input("학번", key="hist_sid", max_chars=10)
+    h_filters = {"date_from": h_range[0] if len(h_range) > 0 else None, "date_to": h_range[1] if len(h_range) > 1 else None,
+                 "room": None if h_room == "전체" else h_room, "student_id": h_sid.strip() or None}
+    page_size = 50
+    h_page = st.session_state.get("hist_page", 1)
+    df_history, h_total = get_store().history_page(h_page - 1, page_size, **h_filters)
+    n_pages = max(1, (h_total - 1) // page_size + 1)
+    if h_page > n_pages:  # 필터가 바뀌어 페이지 수가 줄어든 경우
+        h_page = st.session_state["hist_page"] = n_pages
+        df_history, h_total = get_store().history_page(h_page - 1, page_size, **h_filters)
+    if h_total:
+        st.number_input(f"페이지 (총 {n_pages}쪽, {h_total}건)", min_value=1, max_value=n_pages, key="hist_page")
+        st.dataframe(df_history, width="stretch")
+
+        def export_history():
+            # 버튼을 누를 때만 만듭니다. Streamlit 이 응답 전체를 bytes 로 받으므로 CSV 조각을 이어 붙여 돌려주되,
+            # 기록을 조각 단위로 읽어 전체 DataFrame 을 한꺼번에 만들지는 않습니다.
+            return b"".join(get_store().iter_history_csv(**h_filters))
+        st.download_button("📥 조회 조건 기록 다운로드", data=export_history, file_name="bio_history.csv", mime="text/csv")
+    else: st.info("조건에 맞는 예약 기록이 없습니다.")
+
+
+def archived_reservations():
+    st.markdown("#### 🗄️ 날짜별 지난 예약")
+    archive_dates = get_store().archive_dates()
+    if archive_dates:
+        a_date = st.selectbox("보관 날짜 선택", archive_dates[::-1], key="archive_date")
+        st.dataframe(get_store().archived(a_date), width="stretch")
+    else: st.info("보관된 지난 예약이 없습니다.")
+
+
+def performance():
+    st.markdown(f"#### ⏱️ 구간별 처리 시간 (최근 {metrics.RING_SIZE}회 재실행)")
+    if not metrics.ENABLED: st.info("계측이 꺼져 있습니다. (STUDYROOM_METRICS=0)")
+    elif not metrics.recent(): st.info("아직 기록된 재실행이 없습니다.")
+    else:
+        st.dataframe(metrics.phase_summary(), width="stretch", hide_index=True)
+        mutation_rows = metrics.mutation_summary()
+        if mutation_rows:
+            st.markdown("##### ✍️ 쓰기 작업 지연")
+            st.dataframe(mutation_rows, width="stretch", hide_index=True)
+        st.markdown("##### 🐢 가장 느렸던 재실행")
+        st.dataframe(metrics.slowest(10), width="stretch", hide_index=True)
+        if metrics.METRICS_FILE: st.caption(f"지표 파일: {metrics.METRICS_FILE}")
+
+
+ADMIN_TABS = [("📝 실시간 예약", live_reservations), ("📜 누적 전체 기록", history_records),
+              ("🗄️ 지난 예약 보관함", archived_reservations), ("⏱️ 성능", performance)]
+
+
+@fragment("admin")
+def panel():
+    pw = st.text_input("관리자 비밀번호", type="password", key="admin_pw")
+    if pw == "bio1234":
+        containers = st.tabs([label for label, _ in ADMIN_TABS], key="admin_tab", on_change="rerun")
+        for container, (_, draw) in zip(containers, ADMIN_TABS):
+            with container:
+                if container.open is not False:
+                    draw()
@@ -0,0 +1,48 @@
+"""화면 공용 요소: 스타일, 학과 목록, 계측을 붙인 fragment."""
+import functools
+
+import streamlit as st
+
+from studyroom import metrics
+from studyroom.clock import get_kst_now
+
+DEPTS = ["스마트팜과학과", "식품생명공학과", "유전생명공학과", "융합바이오·신소재공학과"]
+
+CSS = """
+    <style>
+    :root { --point-color: #A7D7C5; --point-dark: #3E7D6B; }
+    .stButton>button { background-color: var(--point-color); color: white; border-radius: 10px; font-weight: bold; border: none; width: 100%; height: 3.2rem; }
+    .stButton>button:disabled { background-color: #E0E0E0 !important; color: #9E9E9E !important; cursor: not-allowed !important; }
+    .schedule-card, .res-card { padding: 15px; border-radius: 12px; border-left: 6px solid var(--point-color); background-color: rgba(167, 215, 197, 0.1); margin-bottom: 12px; }
+    .step-header { color: var(--point-dark); font-weight: bold; border-bottom: 2px solid var(--point-color); padding-bottom: 5px; margin-bottom: 15px; font-size: 1.1rem; }
+    .success-receipt { border: 2px dashed var(--point-color); padding: 25px; border-radius: 15px; margin-top: 20px; background-color: white; color: black; }
+    .receipt-title { color: var(--point-color); font-size: 1.5rem; font-weight: bold; text-align: center; margin-bottom: 20px; }
+    .receipt-item { display: flex; justify-content: space-between; margin-bottom: 10px; border-bottom: 1px solid rgba(167, 215, 197, 0.3); padding-bottom: 5px; }
+    </style>
+    """
+
+
+def now_kst():
+    """현재 한국 시각(시간대 정보 없음)."""
+    return get_kst_now().replace(tzinfo=None)
+
+
+def fragment(name, run_every=None):
+    """계측 구간 이름을 붙인 st.fragment.
+
+    앱 전체가 다시 실행될 때는 그 재실행 기록의 한 구간으로, fragment 만 다시 실행될 때는
+    'fragment:<이름>' 종류의 기록 한 건으로 남깁니다.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            if metrics.active():
+                with metrics.phase(name):
+                    return fn(*args, **kwargs)
+            metrics.begin_rerun(f"fragment:{name}")
+            with metrics.phase(name):
+                result = fn(*args, **kwargs)
+            metrics.end_rerun()
+            return result
+        return st.fragment(timed, run_every=run_every)
+    return decorate
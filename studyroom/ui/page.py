@@ -0,0 +1,27 @@
+"""예약 메인 화면."""
+import streamlit as st
+
+from studyroom import metrics
+from studyroom.store import get_store
+from studyroom.ui import sidebar, tabs
+from studyroom.ui.common import CSS, now_kst
+
+
+def render():
+    st.set_page_config(page_title="생명과학대학 스터디룸 예약", page_icon="🌿", layout="wide")
+    st.markdown(CSS, unsafe_allow_html=True)
+
+    # 그날 첫 요청에서 지난 날짜의 예약을 보관 세그먼트로 옮겨 활성 데이터를 오늘/내일 분량으로 유지
+    with metrics.phase("compaction"):
+        get_store().ensure_compacted(now_kst().date())
+
+    sidebar.render()
+
+    st.title("생명과학대학 스터디룸 예약")
+    tabs.render()
+
+    st.markdown('<div style="height:100px;"></div>', unsafe_allow_html=True)
+    with st.expander("🛠️ 관리자 전용 메뉴", key="admin_open", on_change="rerun") as box:
+        if box.open is not False:
+            from studyroom.ui import admin  # 관리자 화면은 펼쳤을 때만 불러옵니다.
+            admin.panel()
@@ -0,0 +1,43 @@
+"""QR 입실 인증 화면.
+
+문 앞에서 QR 을 찍은 경우에는 해당 예약 한 건만 인증하고 가벼운 확인 화면만 그립니다.
+"""
+from datetime import timedelta
+
+import streamlit as st
+
+from studyroom.config import ROOM_CODES
+from studyroom.store import get_store
+from studyroom.ui.common import now_kst
+
+
+def process_qr_checkin():
+    """QR 코드를 통한 입실 처리를 수행합니다."""
+    room_code = st.query_params["checkin"]
+    target_room = ROOM_CODES.get(room_code)
+    if target_room is None:
+        st.error(f"❌ 등록되지 않은 QR 코드입니다. ({room_code})")
+        return
+
+    now = now_kst()
+    now_time = now.strftime("%H:%M")
+
+    # 예약 시작 15분 전부터 종료 시각 전까지만 인증 가능하도록 설정
+    early_limit = (now + timedelta(minutes=15)).strftime("%H:%M")
+
+    # 조건: 방번호 일치 + 날짜 일치 + 현재 시간이 (시작-15분)보다 뒤 + 종료시간 전 + 미입실 상태
+    user_name = get_store().check_in(target_room, now.date(), now_time, early_limit)
+    if user_name is not None:
+        st.success(f"✅ 인증 성공: {user_name}님, {target_room} 입실 확인되었습니다!")
+        # 인증 후 URL 파라미터를 비워 중복 실행 방지
+        st.query_params.clear()
+    else:
+        st.warning(f"⚠️ {target_room} 인증 실패: 현재 예약 시간이 아니거나 이미 인증되었습니다.")
+
+
+def render():
+    st.set_page_config(page_title="스터디룸 입실 인증", page_icon="🌿")
+    process_qr_checkin()
+    if st.button("🏠 예약 페이지로 이동"):
+        st.query_params.clear()
+        st.rerun()
@@ -0,0 +1,42 @@
+"""사이드바 실시간 예약 현황. SIDEBAR_REFRESH 초마다 사이드바만 다시 그립니다."""
+import streamlit as st
+
+from studyroom.config import ROOMS, SIDEBAR_REFRESH
+from studyroom.service import get_latest_df
+from studyroom.store import get_store
+from studyroom.ui.common import fragment, now_kst
+
+
+@fragment("sidebar", run_every=SIDEBAR_REFRESH)
+def live_status():
+    now = now_kst()
+    current_time_str = now.strftime("%H:%M")
+    df_all = get_latest_df()
+    st.markdown(f"<h2 style='color:var(--point-color);'>📊 실시간 예약 현황</h2>", unsafe_allow_html=True)
+    today_res = df_all[df_all["날짜"] == str(now.date())]
+    grid = get_store().occupancy()
+    for r in ROOMS:
+        with st.expander(f"🚪 {r}", expanded=True):
+            room_today = today_res[today_res["방번호"] == r].sort_values(by="시작")
+            # 점유 격자로 현재 칸이 차 있는지 먼저 보고, 비어 있으면 미리 입실 인증한 팀만 확인합니다.
+            if grid.occupied(now.date(), r, current_time_str):
+                occ = room_today[(room_today["시작"] <= current_time_str) & (room_today["종료"] > current_time_str)]
+            else:
+                occ = room_today[(room_today["출석"] == "입실완료") & (room_today["종료"] > current_time_str)]
+            if not occ.empty:
+                current_user = occ.iloc[0]
+                status_color = "#3E7D6B" if current_user["출석"] == "입실완료" else "#E67E22"
+                st.markdown(f'<div style="margin-bottom: -15px;"><h3 style="color:{status_color}; margin-bottom: 5px;">{"현재 이용 중" if current_user["출석"] == "입실완료" else "인증 대기 중"}</h3><p style="font-size: 1.1rem; font-weight: bold;">⏰ 종료 예정 시각: <span style="background-color: #f0f2f6; padding: 2px 5px; border-radius: 4px; color: black;">{current_user["종료"]}</span></p></div>', unsafe_allow_html=True)
+                if current_user["출석"] == "미입실": st.warning("⚠️ 15분 내 QR 인증 필요")
+                st.divider()
+            else: st.success("현재 비어 있음")
+            next_res = get_store().intervals().bookings_after(now.date(), r, current_time_str)
+            st.markdown("<p style='font-size: 0.9rem; font-weight: bold; margin-bottom: 5px;'>📅 다음 예약 안내</p>", unsafe_allow_html=True)
+            if next_res:
+                for n_start, n_end in next_res: st.caption(f"🕒 {n_start} ~ {n_end} (예약 완료)")
+            else: st.caption("이후 예정된 예약이 없습니다.")
+
+
+def render():
+    with st.sidebar:
+        live_status()
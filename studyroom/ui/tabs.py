@@ -0,0 +1,201 @@
+"""메인 화면의 다섯 탭.
+
+탭 전환은 앱을 다시 실행하되 선택된 탭만 그리고, 탭 안의 위젯 조작은 그 탭 fragment 만 다시 실행합니다.
+"""
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from studyroom.config import ROOMS
+from studyroom.service import check_overlap, check_team_duplication, find_reservations, get_latest_df
+from studyroom.store import DUPLICATE, OVERLAP, STALE, get_store
+from studyroom.ui.common import DEPTS, fragment, now_kst
+
+# 그려지지 않은 위젯의 값은 Streamlit 이 지우므로, 다른 탭을 보고 돌아와도 입력이 남도록 보존할 위젯 키.
+FORM_KEY_PREFIXES = ("reg_", "rep_", "m_dept_", "m_n_", "m_id_", "lookup_", "ext_n_input", "ext_id_input",
+                     "ext_sel_box", "can_n_input", "can_id_input")
+
+
+@fragment("booking")
+def booking():
+    now = now_kst()
+    if 'reserve_success' not in st.session_state:
+        st.session_state.reserve_success = False
+        st.session_state.last_res = {}
+
+    if not st.session_state.reserve_success:
+        st.markdown('<div class="step-header">1. 이용 인원 및 구성원 정보 입력</div>', unsafe_allow_html=True)
+        ic1, _ = st.columns([1, 2])
+        total_count = ic1.selectbox("이용 인원", [3, 4, 5, 6], key="reg_count")
+
+        st.write("**👤 대표자**")
+        rc1, rc2, rc3 = st.columns([1.5, 1.2, 1])
+        rep_dept = rc1.selectbox("학과", DEPTS, key="rep_dept", label_visibility="collapsed")
+        rep_name = rc2.text_input("이름", key="rep_name", placeholder="성함", label_visibility="collapsed")
+        rep_id = rc3.text_input("학번", key="rep_id", max_chars=10, placeholder="10자리", label_visibility="collapsed")
+
+        st.write(f"**👥 구성원 ({total_count-1}명)**")
+        member_names, member_ids = [], []
+        for i in range(total_count - 1):
+            mc1, mc2, mc3 = st.columns([1.5, 1.2, 1])
+            mc1.selectbox(f"학과{i}", DEPTS, key=f"m_dept_{i}", label_visibility="collapsed")
+            m_name = mc2.text_input(f"이름{i}", key=f"m_n_{i}", placeholder="성함", label_visibility="collapsed")
+            m_id = mc3.text_input(f"학번{i}", key=f"m_id_{i}", max_chars=10, placeholder="10자리", label_visibility="collapsed")
+            member_names.append(m_name.strip()); member_ids.append(m_id.strip())
+
+        st.markdown('<div class="step-header">2. 예약 날짜/장소/시간 선택</div>', unsafe_allow_html=True)
+        sc1, sc2, tc1, tc2 = st.columns([1.2, 1.2, 1, 1])
+        room = sc1.selectbox("🚪 장소", ROOMS, key="reg_room")
+        date_options = [now.date(), (now + timedelta(days=1)).date()]
+        sel_date = sc2.selectbox("📅 날짜", date_options, format_func=lambda x: x.strftime("%Y-%m-%d"), key="reg_date")
+        threshold_time = (now - timedelta(minutes=15)).strftime("%H:%M")
+        # 이미 예약된 칸은 처음부터 선택지에서 빼고, 종료는 다음 예약 전까지만 고를 수 있게 합니다.
+        grid = get_store().occupancy()
+        free_starts = grid.free_starts(sel_date, room)
+        available_start = [t for t in free_starts if t >= threshold_time] if str(sel_date) == str(now.date()) else free_starts
+        st_t = tc1.selectbox("⏰ 시작", available_start, key="reg_start")
+        en_t = tc2.selectbox("⏰ 종료", grid.free_ends(sel_date, room, st_t) if st_t else [], key="reg_end")
+        if not available_start: st.warning("선택한 날짜에는 이 장소에 예약 가능한 시간이 없습니다.")
+        elif st_t and en_t:
+            # 오늘은 이미 지난 시간대면 예약할 수 없으므로 제안에서 뺍니다.
+            hint_dates = [d for d in date_options if d != now.date() or st_t >= threshold_time]
+            other_rooms = [f"{d} {r}" for d, r in grid.find_free_rooms(hint_dates, st_t, en_t) if (d, r) != (str(sel_date), room)]
+            if other_rooms: st.caption(f"💡 같은 시간({st_t}~{en_t})에 비어 있는 다른 장소: " + ", ".join(other_rooms))
+
+        all_ids = [rep_id.strip()] + member_ids
+        id_to_name = {rep_id.strip(): rep_name.strip()}
+        for m_id, m_name in zip(member_ids, member_names):
+            id_to_name[m_id] = m_name
+
+        is_ready = st_t and en_t and rep_name and len(rep_id)==10 and all(member_names) and all(len(idx)==10 for idx in all_ids)
+
+        if st.button("🚀 예약 신청하기", key="btn_reservation", disabled=not is_ready):
+            duration = datetime.strptime(en_t, "%H:%M") - datetime.strptime(st_t, "%H:%M")
+            duplicate_found, culprit_id = check_team_duplication(all_ids, sel_date)
+            if duration > timedelta(hours=3): st.error("🚫 최대 이용 가능 시간은 3시간입니다.")
+            elif duplicate_found:
+                culprit_name = id_to_name.get(culprit_id, culprit_id)
+                st.error(f"❌ 예약 실패: '{culprit_name}'님은 해당 날짜에 이미 예약 내역이 있습니다.")
+            elif check_overlap(sel_date, st_t, en_t, room): st.error("❌ 이미 예약된 시간입니다.")
+            else:
+                new_data = {"학과": rep_dept, "이름": rep_name.strip(), "학번": rep_id.strip(), "인원": total_count, "날짜": str(sel_date),
+                            "시작": st_t, "종료": en_t, "방번호": room, "출석": "미입실", "팀원학번": ",".join(member_ids)}
+
+                # 위 검사는 캐시 기준의 빠른 사전 검사이고, 최종 검사와 기록(실시간 예약 + 누적 히스토리)은 한 트랜잭션에서 수행
+                result = get_store().reserve(new_data, now_kst().strftime("%Y-%m-%d %H:%M:%S"))
+                if result.reason == DUPLICATE:
+                    st.error(f"❌ 예약 실패: '{id_to_name.get(result.student_id, result.student_id)}'님은 해당 날짜에 이미 예약 내역이 있습니다.")
+                elif result.reason == OVERLAP: st.error("❌ 방금 다른 사용자가 같은 시간을 먼저 예약했습니다.")
+                elif not result.ok: st.error("⏳ 예약 신청이 몰려 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.")
+                else:
+                    st.session_state.reserve_success = True
+                    st.session_state.last_res = {"name": rep_name, "sid": rep_id, "room": room, "date": str(sel_date), "start": st_t, "end": en_t}
+                    # 사이드바와 다른 탭에도 새 예약이 보이도록 앱 전체를 다시 실행합니다.
+                    st.rerun()
+    else:
+        res = st.session_state.last_res
+        st.success("🎉 예약 완료!")
+        if st.button("처음으로 돌아가기"):
+            st.session_state.reserve_success = False
+            st.rerun()
+
+
+@fragment("lookup")
+def lookup():
+    st.markdown('<div class="step-header">🔍 내 예약 내역 확인</div>', unsafe_allow_html=True)
+    mc1, mc2 = st.columns(2)
+    m_n = mc1.text_input("조회할 이름", key="lookup_n")
+    m_s = mc2.text_input("조회할 학번", key="lookup_s", max_chars=10)
+    if st.button("조회하기", key="btn_lookup"):
+        res_list = find_reservations(m_s)
+        # 대표자로 등록된 예약은 이름까지 일치해야 조회됩니다.
+        res_list = res_list[(res_list["학번"] != m_s.strip()) | (res_list["이름"] == m_n.strip())]
+        if not res_list.empty:
+            for _, r in res_list.iterrows(): st.markdown(f'<div class="res-card">📍 {r["방번호"]} | {r["날짜"]} | ⏰ {r["시작"]}~{r["종료"]} | 상태: {r["출석"]}</div>', unsafe_allow_html=True)
+        else: st.error("조회된 내역이 없습니다.")
+
+
+@fragment("schedule")
+def schedule():
+    df_v = get_latest_df()
+    if not df_v.empty:
+        s_date = st.selectbox("날짜 선택", sorted(df_v["날짜"].unique()), key="view_date")
+        day_df = df_v[df_v["날짜"] == s_date].sort_values(by=["방번호", "시작"])
+        for r_n in ROOMS:
+            st.markdown(f"#### 🚪 {r_n}")
+            room_day = day_df[day_df["방번호"] == r_n]
+            if room_day.empty: st.caption("해당 날짜에 예약이 없습니다.")
+            else:
+                for _, row in room_day.iterrows(): st.markdown(f'<div class="schedule-card"><b>{row["시작"]}~{row["종료"]}</b> | 예약완료</div>', unsafe_allow_html=True)
+    else: st.info("현재 등록된 예약 내역이 없습니다.")
+
+
+@fragment("extension")
+def extension():
+    now = now_kst()
+    st.markdown('<div class="step-header">➕ 이용 시간 연장</div>', unsafe_allow_html=True)
+    ec1, ec2 = st.columns(2)
+    ext_n = ec1.text_input("이름 (연장)", key="ext_n_input")
+    ext_id = ec2.text_input("학번 (연장)", key="ext_id_input", max_chars=10)
+    if st.button("연장 확인", key="btn_ext_check"):
+        res_e = find_reservations(ext_id, now.date())
+        if not res_e.empty:
+            target = res_e.iloc[-1]
+            if target["출석"] != "입실완료": st.error("🚫 QR 인증 후에만 연장이 가능합니다.")
+            else:
+                end_dt = datetime.combine(now.date(), datetime.strptime(target['종료'], "%H:%M").time())
+                if (end_dt - timedelta(minutes=30)) <= now < end_dt:
+                    st.session_state['ext_target'] = target; st.success(f"✅ 연합 가능 (현재 종료: {target['종료']})")
+                else: st.warning("⚠️ 이용 종료 30분 전부터 신청 가능합니다.")
+        else: st.error("오늘 예약 내역 없음")
+    if 'ext_target' in st.session_state:
+        target = st.session_state['ext_target']
+        limit_t = get_store().intervals().next_start(target["날짜"], target["방번호"], target["종료"]) or "23:59"
+        curr_en_dt = datetime.strptime(target['종료'], "%H:%M")
+        opts = [(curr_en_dt + timedelta(minutes=30*i)).strftime("%H:%M") for i in range(1, 5) if (curr_en_dt + timedelta(minutes=30*i)).time() <= datetime.strptime(limit_t, "%H:%M").time()]
+        if not opts: st.error("❌ 다음 예약 일정으로 인해 연장 불가")
+        else:
+            new_en = st.selectbox("새 종료 시각", opts, key="ext_sel_box")
+            if st.button("연장 확정", key="btn_ext_confirm"):
+                result = get_store().set_end_time(target.name, target["종료"], new_en)
+                del st.session_state['ext_target']
+                if result.reason == OVERLAP: st.error("❌ 방금 다른 사용자가 이어지는 시간을 예약해 연장하지 못했습니다.")
+                elif result.reason == STALE: st.error("❌ 예약이 취소되었거나 이미 변경되었습니다. 다시 확인해 주세요.")
+                elif not result.ok: st.error("⏳ 요청이 몰려 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.")
+                else: st.success(f"연장 완료! ({new_en})"); st.rerun()
+
+
+@fragment("cancel")
+def cancel():
+    st.markdown('<div class="step-header">♻️ 예약 반납 및 취소</div>', unsafe_allow_html=True)
+    cc1, cc2 = st.columns(2)
+    can_n = cc1.text_input("이름 (취소)", key="can_n_input")
+    can_id = cc2.text_input("학번 (취소)", key="can_id_input", max_chars=10)
+    if st.button("예약 찾기", key="btn_can_lookup"):
+        res_c = find_reservations(can_id)
+        if not res_c.empty: st.session_state['cancel_list'] = res_c
+        else: st.error("🔍 예약 내역이 없습니다.")
+    if 'cancel_list' in st.session_state:
+        opts = [f"{r['날짜']} | {r['방번호']} ({r['시작']}~{r['종료']})" for _, r in st.session_state['cancel_list'].iterrows()]
+        target_idx = st.selectbox("처리할 내역 선택", range(len(opts)), format_func=lambda x: opts[x])
+        if st.button("최종 취소"):
+            t = st.session_state['cancel_list'].iloc[target_idx]
+            del st.session_state['cancel_list']
+            # 목록을 불러온 뒤 취소·재예약이 있었더라도 다른 팀 예약을 지우지 않도록 예약 id 로 지웁니다.
+            if get_store().delete(t.name): st.rerun()
+            else: st.error("🔍 이미 취소되었거나 반납된 예약입니다.")
+
+
+TABS = [("📅 예약 신청", booking), ("🔍 내 예약 확인", lookup), ("📋 전체 예약 일정", schedule),
+        ("➕ 시간 연장", extension), ("♻️ 반납 및 취소", cancel)]
+
+
+def render():
+    for key in [k for k in st.session_state if k.startswith(FORM_KEY_PREFIXES)]:
+        st.session_state[key] = st.session_state[key]
+    containers = st.tabs([label for label, _ in TABS], key="main_tab", on_change="rerun")
+    for container, (_, draw) in zip(containers, TABS):
+        with container:
+            # 선택되지 않은 탭은 그리지 않아 그 탭이 쓰는 데이터도 읽지 않습니다.
+            if container.open is not False:
+                draw()
@@ -0,0 +1,20 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_e2e_with_more_than_two_rooms(tmp_path):
+    pytest.importorskip("streamlit.testing.v1")
+    out = tmp_path / "result.json"
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    env.pop("STUDYROOM_ROOMS", None)
+    subprocess.run([sys.executable, "-m", "benchmarks", "--rooms", "3", "--days", "5", "--students", "200",
+                    "--repeat", "1", "--only", "e2e", "-o", str(out)], cwd=tmp_path, env=env, check=True, timeout=600)
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert report["params"]["rooms"] == 3
+    assert "tab0_booking_form" in report["e2e"]
@@ -0,0 +1,59 @@
+import pandas as pd
+
+from studyroom import history
+
+COLUMNS = ["날짜", "방번호", "학번", "팀원학번"]
+
+
+def make_source(ids, date, loads, room="1번 스터디룸"):
+    df = pd.DataFrame({"id": ids, "날짜": date, "방번호": room, "학번": [f"2023{i:04d}" for i in ids],
+                       "팀원학번": [f"2024{i:04d},2025{i:04d}" for i in ids]})
+
+    def load(cols):
+        loads.append((date, cols is None))
+        return df if cols is None else df[cols]
+    return load
+
+
+def make_sources(loads):
+    # 최신순: 이번 달(21~25), 지난 달(11~15), 그 전 달(1~5)
+    return [make_source(range(21, 26), "2026-10-01", loads), make_source(range(11, 16), "2026-09-01", loads),
+            make_source(range(1, 6), "2026-08-01", loads)]
+
+
+def page_ids(page_no, page_size=3, **filters):
+    loads = []
+    df, total = history.page(make_sources(loads), COLUMNS, page_no, page_size, **filters)
+    return list(df.index), total, loads
+
+
+def test_first_page_reads_only_newest_source():
+    ids, total, loads = page_ids(0)
+    assert (ids, total) == ([25, 24, 23], 15)
+    assert [date for date, full in loads if full] == ["2026-10-01"]
+
+
+def test_page_across_sources():
+    assert page_ids(1)[:2] == ([22, 21, 15], 15)
+    assert page_ids(3)[:2] == ([11, 5, 4], 15)
+    assert page_ids(4)[:2] == ([3, 2, 1], 15)
+
+
+def test_page_past_end_is_empty_with_columns():
+    ids, total, _ = page_ids(5)
+    assert (ids, total) == ([], 15)
+    df, _ = history.page(make_sources([]), COLUMNS, 5, 3)
+    assert list(df.columns) == COLUMNS
+
+
+def test_filters_apply_before_paging():
+    ids, total, _ = page_ids(0, room="2번 스터디룸")
+    assert (ids, total) == ([], 0)
+    ids, total, _ = page_ids(0, date_from="2026-09-01", date_to="2026-09-30")
+    assert (ids, total) == ([15, 14, 13], 5)
+
+
+def test_student_filter_matches_whole_ids():
+    assert page_ids(0, student_id="20230012")[:2] == ([12], 1)
+    assert page_ids(0, student_id=" 20250003 ")[:2] == ([3], 1)  # 팀원학번 안의 학번
+    assert page_ids(0, student_id="2025")[:2] == ([], 0)
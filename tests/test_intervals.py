@@ -0,0 +1,60 @@
+import pandas as pd
+
+from studyroom.intervals import IntervalIndex, to_hhmm, to_minutes
+
+DATE = "2026-10-17"
+ROOM = "1번 스터디룸"
+
+
+def make_index(*spans, room=ROOM):
+    df = pd.DataFrame([{"날짜": DATE, "방번호": room, "시작": s, "종료": e} for s, e in spans],
+                      columns=["날짜", "방번호", "시작", "종료"])
+    return IntervalIndex.from_frame(df)
+
+
+def test_minutes_round_trip():
+    assert to_minutes("09:30") == 570
+    assert to_hhmm(570) == "09:30"
+
+
+def test_collides_half_open():
+    index = make_index(("10:00", "11:00"))
+    assert index.collides(DATE, ROOM, "10:30", "11:30")
+    assert index.collides(DATE, ROOM, "09:00", "10:30")
+    assert not index.collides(DATE, ROOM, "11:00", "12:00")  # 끝나는 시각에 바로 시작
+    assert not index.collides(DATE, ROOM, "09:00", "10:00")  # 시작하는 시각에 바로 끝남
+
+
+def test_collides_uses_running_max_of_ends():
+    # 일찍 시작한 긴 예약이 뒤의 짧은 예약들보다 늦게 끝납니다. 바로 앞 예약의 종료만 보면 놓칩니다.
+    index = make_index(("09:00", "15:00"), ("10:00", "10:30"), ("11:00", "11:30"))
+    assert index.collides(DATE, ROOM, "12:00", "13:00")
+    assert not index.collides(DATE, ROOM, "15:00", "16:00")
+
+
+def test_collides_other_room_or_date():
+    index = make_index(("10:00", "11:00"))
+    assert not index.collides(DATE, "2번 스터디룸", "10:00", "11:00")
+    assert not index.collides("2026-10-18", ROOM, "10:00", "11:00")
+
+
+def test_malformed_rows_skipped():
+    index = make_index(("10:00", "11:00"), ("", "11:00"), (None, None))
+    assert index.malformed == 2
+    assert index.collides(DATE, ROOM, "10:00", "10:30")
+
+
+def test_next_start_includes_same_time():
+    index = make_index(("10:00", "11:00"), ("13:00", "14:00"))
+    assert index.next_start(DATE, ROOM, "10:00") == "10:00"
+    assert index.next_start(DATE, ROOM, "10:01") == "13:00"
+    assert index.next_start(DATE, ROOM, "13:01") is None
+    assert index.next_start(DATE, "2번 스터디룸", "09:00") is None
+
+
+def test_bookings_after_excludes_same_time():
+    index = make_index(("10:00", "11:00"), ("13:00", "14:00"))
+    assert index.bookings_after(DATE, ROOM, "09:59") == [("10:00", "11:00"), ("13:00", "14:00")]
+    assert index.bookings_after(DATE, ROOM, "10:00") == [("13:00", "14:00")]
+    assert index.bookings_after(DATE, ROOM, "13:00") == []
+    assert index.bookings_after(DATE, "2번 스터디룸", "09:00") == []
@@ -0,0 +1,31 @@
+from studyroom.members import MemberIndex, participants
+
+DATE = "2026-10-17"
+
+
+def test_participants_dedupes_and_strips():
+    assert participants("20230001", " 20230002, ,20230001,20230003 ") == ["20230001", "20230002", "20230003"]
+    assert participants(20230001, ["20230002", ""]) == ["20230001", "20230002"]
+
+
+def test_lookup_is_exact_not_substring():
+    index = MemberIndex([(1, "20230001", DATE), (2, "120230001", DATE)])
+    assert not index.has_booking("2023", DATE)
+    assert not index.has_booking("0001", DATE)
+    assert index.reservation_ids("2023") == []
+    assert index.reservation_ids("20230001") == [1]
+    assert index.reservation_ids("120230001") == [2]
+
+
+def test_has_booking_by_date():
+    index = MemberIndex([(1, "20230001", DATE)])
+    assert index.has_booking("20230001", DATE)
+    assert not index.has_booking("20230001", "2026-10-18")
+    assert not index.has_booking("20239999", DATE)
+
+
+def test_reservation_ids_sorted_and_filtered_by_date():
+    index = MemberIndex([(5, "20230001", "2026-10-18"), (3, "20230001", DATE), (1, "20230001", DATE)])
+    assert index.reservation_ids("20230001") == [1, 3, 5]
+    assert index.reservation_ids("20230001", DATE) == [1, 3]
+    assert index.reservation_ids("20230001", "2026-10-19") == []
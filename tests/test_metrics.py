@@ -0,0 +1,39 @@
+import pytest
+
+from studyroom import metrics
+
+pytestmark = pytest.mark.skipif(not metrics.ENABLED, reason="STUDYROOM_METRICS=0")
+
+
+class Stop(Exception):
+    pass
+
+
+def test_inner_exception_closes_rerun_once_from_outermost_phase():
+    before = len(metrics.recent())
+    outer_count = metrics._phase_totals.get("outer", [0, 0.0])[0]
+    metrics.begin_rerun("test")
+    with pytest.raises(Stop):
+        with metrics.phase("outer"):
+            with metrics.phase("inner"):
+                raise Stop
+    assert not metrics.active()
+    recent = metrics.recent()
+    assert len(recent) == before + 1
+    assert recent[-1].interrupted
+    assert set(recent[-1].phases) == {"outer", "inner"}
+    assert recent[-1].total >= recent[-1].phases["outer"]
+    assert metrics._phase_totals["outer"][0] == outer_count + 1  # 닫힌 뒤가 아니라 닫기 전에 더해짐
+
+
+def test_exception_caught_between_phases_keeps_rerun_open():
+    metrics.begin_rerun("test")
+    with metrics.phase("outer"):
+        try:
+            with metrics.phase("inner"):
+                raise Stop
+        except Stop:
+            pass
+        assert metrics.active()
+    metrics.end_rerun()
+    assert not metrics.recent()[-1].interrupted
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from studyroom.occupancy import OccupancyGrid
+
+ROOMS = ["1번 스터디룸", "2번 스터디룸"]
+
+
+def make_grid(*rows):
+    return OccupancyGrid.from_frame(pd.DataFrame(rows, columns=["날짜", "방번호", "시작", "종료"]), ROOMS)
+
+
+def test_find_free_rooms_skips_booked_and_unknown_dates_are_free():
+    grid = make_grid(("2026-10-17", "1번 스터디룸", "10:00", "11:00"))
+    assert grid.find_free_rooms(["2026-10-17", "2026-10-18"], "10:30", "11:30") == [
+        ("2026-10-17", "2번 스터디룸"), ("2026-10-18", "1번 스터디룸"), ("2026-10-18", "2번 스터디룸")]
+
+
+def test_find_free_rooms_only_suggests_configured_rooms():
+    grid = make_grid(("2026-10-17", "옛 세미나실", "12:00", "13:00"))
+    assert "옛 세미나실" in grid.rooms  # 점유는 격자에 남지만
+    assert grid.find_free_rooms(["2026-10-17"], "10:00", "11:00") == [
+        ("2026-10-17", "1번 스터디룸"), ("2026-10-17", "2번 스터디룸")]